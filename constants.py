@@ -1,36 +1,32 @@
-from enum import Enum, auto
-from dataclasses import dataclass
+from enum import Enum, IntEnum, auto
+from dataclasses import dataclass, field
 from typing import Optional
 import time
 
 
-class Direction(Enum):
-    """Elevator direction states"""
-    UP = "UP"
-    DOWN = "DOWN"
-    IDLE = "IDLE"
+class Direction(IntEnum):
+    """Elevator direction states (value is the floor delta per step)"""
+    UP = 1
+    DOWN = -1
+    IDLE = 0
     
     def __str__(self) -> str:
-        return self.value
+        return self.name
     
     def opposite(self) -> 'Direction':
         """Get the opposite direction"""
-        if self == Direction.UP:
-            return Direction.DOWN
-        elif self == Direction.DOWN:
-            return Direction.UP
-        return Direction.IDLE
+        return Direction(-self.value)
 
 
-class DoorState(Enum):
+class DoorState(IntEnum):
     """Elevator door states"""
-    OPEN = "OPEN"
-    CLOSED = "CLOSED"
-    OPENING = "OPENING"
-    CLOSING = "CLOSING"
+    CLOSED = 0
+    OPENING = 1
+    OPEN = 2
+    CLOSING = 3
     
     def __str__(self) -> str:
-        return self.value
+        return self.name
 
 
 class EmergencyPriority(Enum):
@@ -43,7 +39,7 @@ class EmergencyPriority(Enum):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     """Represents an elevator request"""
     floor: int
@@ -54,10 +50,10 @@ class Request:
     
     def __post_init__(self):
         if self.timestamp == 0.0:
-            self.timestamp = time.time()
+            self.timestamp = time.monotonic()
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EmergencyRequest:
     """Represents an emergency elevator request with pickup and destination"""
     from_floor: int
@@ -65,10 +61,13 @@ class EmergencyRequest:
     priority: EmergencyPriority = EmergencyPriority.CRITICAL
     timestamp: float = 0.0
     is_picked_up: bool = False
+    # Hash of (from_floor, to_floor), computed once; the floors act as the key
+    _hash: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp == 0.0:
-            self.timestamp = time.time()
+            self.timestamp = time.monotonic()
+        self._hash = hash((self.from_floor, self.to_floor))
     
     def __eq__(self, other):
         if isinstance(other, EmergencyRequest):
@@ -78,13 +77,13 @@ class EmergencyRequest:
         return False
     
     def __hash__(self):
-        return hash((self.from_floor, self.to_floor))
+        return self._hash
     
     def to_tuple(self) -> tuple:
         return (self.from_floor, self.to_floor)
 
 
-@dataclass
+@dataclass(slots=True)
 class ElevatorStats:
     """Statistics for elevator performance"""
     total_floors_traveled: int = 0
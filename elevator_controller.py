@@ -2,6 +2,16 @@ from typing import Optional
 from constants import Direction, DoorState, ElevatorStats
 
 
+# Door state machine: state -> (next state, timer for next state).
+# A timer of None means "use the controller's door_open_duration".
+# CLOSED has no entry: the doors are at rest.
+_DOOR_TRANSITIONS = {
+    DoorState.OPENING: (DoorState.OPEN, None),
+    DoorState.OPEN: (DoorState.CLOSING, 1),
+    DoorState.CLOSING: (DoorState.CLOSED, 0),
+}
+
+
 class ElevatorController:
     """Controls the physical state and movement of the elevator."""
     
@@ -9,6 +19,8 @@ class ElevatorController:
         self.num_floors: int = num_floors
         self.current_floor: int = start_floor
         self.direction: Direction = Direction.IDLE
+        # Floor delta per step, kept in sync with direction
+        self._direction_delta: int = 0
         self.door_state: DoorState = DoorState.CLOSED
         self.is_moving: bool = False
         self.target_floor: Optional[int] = None
@@ -34,11 +46,16 @@ class ElevatorController:
         """Get the current door state."""
         return self.door_state
     
-    def set_direction(self, direction: Direction | str) -> None:
+    def set_direction(self, direction: Direction) -> None:
         """Set direction: Direction.UP, Direction.DOWN, or Direction.IDLE"""
-        if isinstance(direction, str):
-            direction = Direction(direction)
         self.direction = direction
+        self._direction_delta = direction.value
+    
+    def set_direction_any(self, direction: Direction | str) -> None:
+        """Set direction from a Direction or its name ("UP", "DOWN", "IDLE")."""
+        if isinstance(direction, str):
+            direction = Direction[direction]
+        self.set_direction(direction)
     
     def open_doors(self) -> None:
         """Start opening the doors."""
@@ -57,27 +74,16 @@ class ElevatorController:
         Update door state based on timer.
         Returns True if doors are currently in transition.
         """
-        if self.door_state == DoorState.OPENING:
-            self.door_timer -= 1
-            if self.door_timer <= 0:
-                self.door_state = DoorState.OPEN
-                self.door_timer = self.door_open_duration
-            return True
-            
-        elif self.door_state == DoorState.OPEN:
-            self.door_timer -= 1
-            if self.door_timer <= 0:
-                self.door_state = DoorState.CLOSING
-                self.door_timer = 1
-            return True
-            
-        elif self.door_state == DoorState.CLOSING:
-            self.door_timer -= 1
-            if self.door_timer <= 0:
-                self.door_state = DoorState.CLOSED
-            return True
-            
-        return False
+        transition = _DOOR_TRANSITIONS.get(self.door_state)
+        if transition is None:
+            return False
+        
+        self.door_timer -= 1
+        if self.door_timer <= 0:
+            next_state, next_timer = transition
+            self.door_state = next_state
+            self.door_timer = self.door_open_duration if next_timer is None else next_timer
+        return True
     
     def can_move(self) -> bool:
         """Check if elevator can move (doors must be closed)."""
@@ -87,6 +93,7 @@ class ElevatorController:
         """Set target floor and determine direction."""
         if target_floor == self.current_floor:
             self.direction = Direction.IDLE
+            self._direction_delta = 0
             self.target_floor = None
             return
         
@@ -98,37 +105,43 @@ class ElevatorController:
             self.direction = Direction.UP
         else:
             self.direction = Direction.DOWN
+        self._direction_delta = self.direction.value
         self.is_moving = True
     
-    def step(self) -> bool:
+    def step(self, floors_this_tick: int = 1) -> bool:
         """
         Simulate one step of elevator movement.
+        floors_this_tick lets a fast simulation cover several floors (and
+        door ticks) per call; movement never passes the target floor.
         Returns True if arrived at target floor.
         """
         # Handle door transitions first
         if self.door_state != DoorState.CLOSED:
-            self.update_doors()
+            for _ in range(floors_this_tick):
+                if not self.update_doors():
+                    break
             return False
         
-        if self.target_floor is None:
+        target_floor = self.target_floor
+        if target_floor is None:
             self.is_moving = False
             self.direction = Direction.IDLE
+            self._direction_delta = 0
             return False
         
-        if self.current_floor == self.target_floor:
+        if self.current_floor == target_floor:
             self.is_moving = False
             self.target_floor = None
             # Note: Don't auto-open doors here - let the system control this
             # based on whether we should serve a request at this floor
             return True  # Arrived at target
         
-        # Move one floor
-        if self.direction == Direction.UP:
-            self.current_floor += 1
-            self.stats.total_floors_traveled += 1
-        elif self.direction == Direction.DOWN:
-            self.current_floor -= 1
-            self.stats.total_floors_traveled += 1
+        # Move up to floors_this_tick floors, stopping at the target
+        delta = self._direction_delta
+        if delta:
+            floors = min(floors_this_tick, abs(target_floor - self.current_floor))
+            self.current_floor += delta * floors
+            self.stats.total_floors_traveled += floors
         
         return False  # Still moving
     
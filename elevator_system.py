@@ -1,10 +1,121 @@
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Iterable, Optional, Tuple, Deque, NamedTuple
+from collections import deque
+from itertools import islice
+import time
 from elevator_controller import ElevatorController
 from queue_manager import QueueManager
 from emergency_handler import EmergencyHandler
 from constants import Direction, DoorState
 
 
+# Display names of the enum members, built once so status snapshots
+# look names up instead of calling __str__
+_DIRECTION_NAMES: Dict[Direction, str] = {d: str(d) for d in Direction}
+_DOOR_STATE_NAMES: Dict[DoorState, str] = {s: str(s) for s in DoorState}
+
+
+class ElevatorStatus(NamedTuple):
+    """Snapshot of the fields the UI redraws from (see get_display_status)."""
+    floor: int
+    direction: str
+    direction_enum: Direction
+    door_state: DoorState
+    emergency_mode: bool
+    emergency_count: int
+    stats: Dict[str, Any]
+    pending_requests: Dict[str, list]
+
+
+def _lowest_floor(mask: int) -> int:
+    """Lowest floor set in a non-empty floor bitmask."""
+    return (mask & -mask).bit_length() - 1
+
+
+def _highest_floor(mask: int) -> int:
+    """Highest floor set in a non-empty floor bitmask."""
+    return mask.bit_length() - 1
+
+
+def _closest_floor(mask: int, current_floor: int) -> Optional[int]:
+    """Find the floor in a floor bitmask closest to current_floor (lower wins ties)."""
+    below_mask = mask & ((1 << current_floor) - 1)
+    above_mask = mask ^ below_mask
+    if not above_mask:
+        return _highest_floor(below_mask) if below_mask else None
+    above = _lowest_floor(above_mask)
+    if not below_mask:
+        return above
+    below = _highest_floor(below_mask)
+    return above if above - current_floor < current_floor - below else below
+
+
+def _next_normal_target(
+    internal: int,
+    external_up: int,
+    external_down: int,
+    current_floor: int,
+    current_direction: Direction
+) -> Optional[int]:
+    """
+    Pick the next normal (non-emergency) target floor.
+    Pure function of the request bitmasks, current floor and direction.
+    """
+    # Floors strictly above / below the current floor
+    above = ~((2 << current_floor) - 1)
+    below = (1 << current_floor) - 1
+    
+    # Check internal requests first
+    if internal:
+        if current_direction == Direction.UP:
+            # Find next floor above current
+            if internal & above:
+                return _lowest_floor(internal & above)
+            # No floors above, reverse to the highest request
+            return _highest_floor(internal)
+                
+        elif current_direction == Direction.DOWN:
+            # Find next floor below current
+            if internal & below:
+                return _highest_floor(internal & below)
+            # No floors below, reverse to the lowest request
+            return _lowest_floor(internal)
+                
+        else:  # IDLE
+            # Go to closest floor
+            return _closest_floor(internal, current_floor)
+    
+    # Check external requests
+    if current_direction == Direction.UP:
+        # Check external UP requests
+        if external_up & above:
+            return _lowest_floor(external_up & above)
+        # Check external DOWN requests (need to reverse)
+        if external_down:
+            return _highest_floor(external_down)
+            
+    elif current_direction == Direction.DOWN:
+        # Check external DOWN requests
+        if external_down & below:
+            return _highest_floor(external_down & below)
+        # Check external UP requests (need to reverse)
+        if external_up:
+            return _lowest_floor(external_up)
+            
+    else:  # IDLE
+        # Closest external request of either kind (UP wins ties)
+        closest_up = _closest_floor(external_up, current_floor)
+        closest_down = _closest_floor(external_down, current_floor)
+        if closest_down is None:
+            return closest_up
+        if closest_up is None:
+            return closest_down
+        if abs(closest_down - current_floor) < abs(closest_up - current_floor):
+            return closest_down
+        return closest_up
+    
+    return None
+
+
 class ElevatorSystem:
     """
     Central coordinator for the elevator system.
@@ -19,11 +130,7 @@ class ElevatorSystem:
     ) -> None:
         self.num_floors: int = num_floors
         self.controller = ElevatorController(num_floors, start_floor)
-        
-        # Convert string direction to enum
-        if isinstance(start_direction, str):
-            start_direction = Direction(start_direction)
-        self.controller.set_direction(start_direction)
+        self.controller.set_direction_any(start_direction)
         
         self.queue_manager = QueueManager(num_floors)
         self.emergency_handler = EmergencyHandler(self.queue_manager)
@@ -32,54 +139,159 @@ class ElevatorSystem:
         self.current_emergency_pickup: Optional[Tuple[int, int]] = None
         self.current_emergency_destination: Optional[Tuple[int, int]] = None
         
+        # Last get_next_target result, keyed by (queue version, floor, direction)
+        self._target_cache_key: Optional[Tuple[int, int, Direction]] = None
+        self._cached_target: Optional[int] = None
+        
+        # Set when update() should look for a new target while idle
+        self._needs_replan: bool = True
+        
+        # Last get_status() result; dropped whenever the state may change
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._display_status_cache: Optional[ElevatorStatus] = None
+        
         # Simulation state
         self.is_paused: bool = False
         self.speed_multiplier: float = 1.0
+        # Whole floors (and door ticks) covered per step at the current speed
+        self.floors_per_step: int = 1
         
-        # Event log for recent activities
-        self.event_log: List[str] = []
+        # Event log for recent activities (oldest entries evicted automatically)
         self.max_log_entries: int = 100
+        self.event_log: Deque[str] = deque(maxlen=self.max_log_entries)
         
     def log_event(self, message: str) -> None:
         """Add an event to the log."""
         self.event_log.append(message)
-        if len(self.event_log) > self.max_log_entries:
-            self.event_log.pop(0)
     
-    def add_internal_request(self, floor: int) -> bool:
+    def _invalidate_status(self) -> None:
+        """Forget the cached status snapshots."""
+        self._status_cache = None
+        self._display_status_cache = None
+    
+    def add_internal_request(self, floor: int, now: Optional[float] = None) -> bool:
         """Add internal request (button pressed inside elevator)."""
         if self.emergency_handler.is_emergency_mode():
             return False
-        result = self.queue_manager.add_internal_request(floor)
+        result = self.queue_manager.add_internal_request(floor, now)
         if result:
+            self._needs_replan = True
+            self._invalidate_status()
             self.log_event(f"Internal request: Floor {floor}")
         return result
     
-    def add_external_request(self, floor: int, direction: str | Direction) -> bool:
+    def add_external_request(
+        self,
+        floor: int,
+        direction: str | Direction,
+        now: Optional[float] = None
+    ) -> bool:
         """Add external request (UP/DOWN button pressed)."""
         if self.emergency_handler.is_emergency_mode():
             return False
-        result = self.queue_manager.add_external_request(floor, direction)
+        result = self.queue_manager.add_external_request(floor, direction, now)
         if result:
+            self._needs_replan = True
+            self._invalidate_status()
             self.log_event(f"External {direction} request: Floor {floor}")
         return result
     
-    def add_emergency_request(self, from_floor: int, to_floor: int) -> bool:
+    def add_emergency_request(
+        self,
+        from_floor: int,
+        to_floor: int,
+        now: Optional[float] = None
+    ) -> bool:
         """Add emergency request."""
-        result = self.queue_manager.add_emergency_request(from_floor, to_floor)
+        result = self.queue_manager.add_emergency_request(from_floor, to_floor, now)
         if result:
             self.emergency_handler.trigger_emergency()
+            self._needs_replan = True
+            self._invalidate_status()
             self.log_event(f"🚨 EMERGENCY: Floor {from_floor} → Floor {to_floor}")
         return result
     
+    def add_internal_requests(self, floors: Iterable[int], now: Optional[float] = None) -> int:
+        """Add several internal requests at once. Returns how many were accepted."""
+        if self.emergency_handler.is_emergency_mode():
+            return 0
+        floors = tuple(floors)
+        count = self.queue_manager.add_internal_requests(floors, now)
+        if count:
+            self._needs_replan = True
+            self._invalidate_status()
+            for floor in floors:
+                if 1 <= floor <= self.num_floors:
+                    self.log_event(f"Internal request: Floor {floor}")
+        return count
+    
+    def add_external_requests(
+        self,
+        floors: Iterable[int],
+        direction: str | Direction,
+        now: Optional[float] = None
+    ) -> int:
+        """Add several external requests in one direction. Returns how many were accepted."""
+        if self.emergency_handler.is_emergency_mode():
+            return 0
+        floors = tuple(floors)
+        count = self.queue_manager.add_external_requests(floors, direction, now)
+        if count:
+            self._needs_replan = True
+            self._invalidate_status()
+            for floor in floors:
+                if 1 <= floor <= self.num_floors:
+                    self.log_event(f"External {direction} request: Floor {floor}")
+        return count
+    
+    def add_emergency_requests(
+        self,
+        requests: Iterable[Tuple[int, int]],
+        now: Optional[float] = None
+    ) -> int:
+        """Add several (from_floor, to_floor) emergency requests. Returns how many were accepted."""
+        requests = tuple(requests)
+        count = self.queue_manager.add_emergency_requests(requests, now)
+        if count:
+            self.emergency_handler.trigger_emergency()
+            self._needs_replan = True
+            self._invalidate_status()
+            num_floors = self.num_floors
+            for from_floor, to_floor in requests:
+                if 1 <= from_floor <= num_floors and 1 <= to_floor <= num_floors:
+                    self.log_event(f"🚨 EMERGENCY: Floor {from_floor} → Floor {to_floor}")
+        return count
+    
+    def _invalidate_target_cache(self) -> None:
+        """Forget the cached next target (emergency tracking changed)."""
+        self._target_cache_key = None
+    
     def get_next_target(self) -> Optional[int]:
         """
         Determine the next target floor based on current state.
         Priority: Emergency requests > Normal requests
+        
+        The result is cached until the queues, floor or direction change.
         """
-        current_floor = self.controller.get_current_floor()
-        current_direction = self.controller.get_direction()
+        controller = self.controller
+        current_floor = controller.current_floor
+        current_direction = controller.direction
         
+        key = (self.queue_manager.queue_version, current_floor, current_direction)
+        if key == self._target_cache_key:
+            return self._cached_target
+        
+        target = self._find_next_target(current_floor, current_direction)
+        self._target_cache_key = key
+        self._cached_target = target
+        return target
+    
+    def _find_next_target(
+        self, 
+        current_floor: int, 
+        current_direction: Direction
+    ) -> Optional[int]:
+        """Compute the next target floor without consulting the cache."""
         # If we're currently handling an emergency destination, continue to it
         if self.current_emergency_destination:
             from_floor, to_floor = self.current_emergency_destination
@@ -94,22 +306,12 @@ class ElevatorSystem:
         
         # Check for emergency requests first
         if self.emergency_handler.is_emergency_mode() and self.queue_manager.has_emergency_requests():
-            target, is_pickup = self.emergency_handler.get_next_emergency_target(
-                current_floor, current_direction
-            )
-            if target is not None:
-                if is_pickup:
-                    # Find which emergency request this pickup is for
-                    group_a, group_b, group_c = self.emergency_handler.sort_emergency_requests(
-                        current_floor, current_direction
-                    )
-                    if group_a:
-                        self.current_emergency_pickup = group_a[0]
-                    elif group_b:
-                        self.current_emergency_pickup = group_b[0]
-                    elif group_c:
-                        self.current_emergency_pickup = group_c[0]
-                return target
+            plan = self.emergency_handler.plan_next(current_floor, current_direction)
+            if plan.target is not None:
+                if plan.is_pickup:
+                    # Remember which emergency request this pickup is for
+                    self.current_emergency_pickup = plan.request
+                return plan.target
         
         # Handle normal requests
         if not self.emergency_handler.is_emergency_mode():
@@ -123,196 +325,188 @@ class ElevatorSystem:
         current_direction: Direction
     ) -> Optional[int]:
         """Get next target for normal (non-emergency) operation."""
-        # Check internal requests first
-        if self.queue_manager.internal_requests:
-            if current_direction == Direction.UP:
-                # Find next floor above current
-                candidates = [f for f in self.queue_manager.internal_requests if f > current_floor]
-                if candidates:
-                    return min(candidates)
-                # No floors above, check if we should reverse
-                if self.queue_manager.internal_requests:
-                    return max(self.queue_manager.internal_requests)
-                    
-            elif current_direction == Direction.DOWN:
-                # Find next floor below current
-                candidates = [f for f in self.queue_manager.internal_requests if f < current_floor]
-                if candidates:
-                    return max(candidates)
-                # No floors below, check if we should reverse
-                if self.queue_manager.internal_requests:
-                    return min(self.queue_manager.internal_requests)
-                    
-            else:  # IDLE
-                if self.queue_manager.internal_requests:
-                    # Go to closest floor
-                    closest = min(self.queue_manager.internal_requests, 
-                                key=lambda x: abs(x - current_floor))
-                    return closest
-        
-        # Check external requests
-        if current_direction == Direction.UP:
-            # Check external UP requests
-            candidates = [f for f in self.queue_manager.external_up_requests if f > current_floor]
-            if candidates:
-                return min(candidates)
-            # Check external DOWN requests (need to reverse)
-            if self.queue_manager.external_down_requests:
-                return max(self.queue_manager.external_down_requests)
-            # Check internal requests in opposite direction
-            if self.queue_manager.internal_requests:
-                return max(self.queue_manager.internal_requests)
-                
-        elif current_direction == Direction.DOWN:
-            # Check external DOWN requests
-            candidates = [f for f in self.queue_manager.external_down_requests if f < current_floor]
-            if candidates:
-                return max(candidates)
-            # Check external UP requests (need to reverse)
-            if self.queue_manager.external_up_requests:
-                return min(self.queue_manager.external_up_requests)
-            # Check internal requests in opposite direction
-            if self.queue_manager.internal_requests:
-                return min(self.queue_manager.internal_requests)
-                
-        else:  # IDLE
-            # Check all external requests
-            all_external = list(self.queue_manager.external_up_requests) + \
-                         list(self.queue_manager.external_down_requests)
-            if all_external:
-                closest = min(all_external, key=lambda x: abs(x - current_floor))
-                return closest
-        
-        return None
+        return _next_normal_target(
+            self.queue_manager.internal_mask,
+            self.queue_manager.ext_up_mask,
+            self.queue_manager.ext_down_mask,
+            current_floor,
+            current_direction
+        )
     
-    def step(self) -> Tuple[bool, Optional[str]]:
+    def step(self, now: Optional[float] = None) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Execute one simulation step.
-        Returns: (arrived_at_floor, message)
+        `now` is the time.monotonic() reading used for every request served
+        in this step (sampled on arrival if not given).
+        Returns: (arrived_at_floor, message, tag) where tag is 'emergency'
+        when an emergency pickup/drop-off happened, 'success' for other
+        arrivals, and None when there is no message
         """
         if self.is_paused:
-            return False, None
-            
-        current_floor = self.controller.get_current_floor()
+            return False, None, None
+        self._invalidate_status()
+        
+        controller = self.controller
+        queue_manager = self.queue_manager
+        emergency_handler = self.emergency_handler
         
         # Check if we've arrived at a floor
-        arrived = self.controller.step()
+        arrived = controller.step(self.floors_per_step)
         
         if arrived:
-            new_floor = self.controller.get_current_floor()
+            if now is None:
+                now = time.monotonic()
+            new_floor = controller.current_floor
             message = f"Arrived at Floor {new_floor}"
+            tag = 'success'
             
             # Handle emergency requests
-            if self.emergency_handler.is_emergency_mode():
+            if emergency_handler.emergency_mode:
                 should_open_doors = False
                 
                 # Check if we're at a pickup point
-                if self.current_emergency_pickup:
-                    from_floor, to_floor = self.current_emergency_pickup
-                    if new_floor == from_floor:
-                        # Picked up, now go to destination
-                        self.current_emergency_destination = self.current_emergency_pickup
-                        self.current_emergency_pickup = None
-                        message += f" [🚨 Emergency Pickup]"
-                        self.controller.add_passenger()
-                        should_open_doors = True
+                pickup = self.current_emergency_pickup
+                if pickup and new_floor == pickup[0]:
+                    # Picked up, now go to destination
+                    self.current_emergency_destination = pickup
+                    self.current_emergency_pickup = None
+                    self._invalidate_target_cache()
+                    message += f" [🚨 Emergency Pickup]"
+                    tag = 'emergency'
+                    controller.add_passenger()
+                    should_open_doors = True
                 
                 # Check if we're at a destination
-                if self.current_emergency_destination:
-                    from_floor, to_floor = self.current_emergency_destination
-                    if new_floor == to_floor:
-                        # Reached destination, complete the emergency
-                        self.queue_manager.remove_emergency_request(from_floor, to_floor)
-                        self.emergency_handler.complete_emergency_request(from_floor, to_floor)
-                        self.current_emergency_destination = None
-                        message += f" [✅ Emergency Complete: {from_floor}→{to_floor}]"
-                        self.controller.remove_passenger()
-                        should_open_doors = True
+                destination = self.current_emergency_destination
+                if destination and new_floor == destination[1]:
+                    # Reached destination, complete the emergency
+                    from_floor, to_floor = destination
+                    queue_manager.remove_emergency_request(from_floor, to_floor, now)
+                    emergency_handler.complete_emergency_request(from_floor, to_floor, now)
+                    self.current_emergency_destination = None
+                    self._invalidate_target_cache()
+                    message += f" [✅ Emergency Complete: {from_floor}→{to_floor}]"
+                    tag = 'emergency'
+                    controller.remove_passenger()
+                    should_open_doors = True
                 
                 # Only open doors at emergency stops
                 if should_open_doors:
-                    self.controller.open_doors()
+                    controller.open_doors()
             
-            # Handle normal requests
-            if not self.emergency_handler.is_emergency_mode():
+            # Handle normal requests (emergency mode may have just ended above,
+            # which swaps the queues back in, so read the masks only now)
+            if not emergency_handler.emergency_mode:
                 should_open_doors = False
                 
                 # Remove internal request if present
-                if new_floor in self.queue_manager.internal_requests:
-                    self.queue_manager.remove_internal_request(new_floor)
+                if (queue_manager.internal_mask >> new_floor) & 1:
+                    queue_manager.remove_internal_request(new_floor, now)
                     message += " [Internal Served]"
-                    self.controller.remove_passenger()
+                    controller.remove_passenger()
                     should_open_doors = True
                 
                 # Remove external requests if present
-                current_dir = self.controller.get_direction()
-                if new_floor in self.queue_manager.external_up_requests:
-                    self.queue_manager.remove_external_request(new_floor, "UP")
+                if (queue_manager.ext_up_mask >> new_floor) & 1:
+                    queue_manager.remove_external_request(new_floor, "UP", now)
                     message += " [External ↑ Served]"
-                    self.controller.add_passenger()
+                    controller.add_passenger()
                     should_open_doors = True
-                if new_floor in self.queue_manager.external_down_requests:
-                    self.queue_manager.remove_external_request(new_floor, "DOWN")
+                if (queue_manager.ext_down_mask >> new_floor) & 1:
+                    queue_manager.remove_external_request(new_floor, "DOWN", now)
                     message += " [External ↓ Served]"
-                    self.controller.add_passenger()
+                    controller.add_passenger()
                     should_open_doors = True
                 
                 # Open doors when serving requests
                 if should_open_doors:
-                    self.controller.open_doors()
+                    controller.open_doors()
             
             self.log_event(message)
             
             # Determine next target
             next_target = self.get_next_target()
             if next_target is not None:
-                self.controller.move_to_floor(next_target)
+                controller.move_to_floor(next_target)
             else:
-                self.controller.set_direction(Direction.IDLE)
+                controller.set_direction(Direction.IDLE)
+            if controller.target_floor is None:
+                self._needs_replan = True
             
-            return True, message
+            return True, message, tag
         
         # Still moving
-        return False, None
+        return False, None, None
     
-    def update(self) -> Tuple[bool, Optional[str]]:
-        """Update the elevator system - called periodically."""
+    def update(self, now: Optional[float] = None) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Update the elevator system - called periodically. Returns step()'s result."""
         if self.is_paused:
-            return False, None
+            return False, None, None
             
-        # If no target is set, find one
-        if self.controller.target_floor is None:
+        # If no target is set, find one. Once idle with nothing to do, the
+        # plan cannot change until a request arrives, so stop re-planning;
+        # a controller that still has a direction drops it to IDLE on the
+        # next step, which can change the plan, so allow one more pass.
+        controller = self.controller
+        if self._needs_replan and controller.target_floor is None:
             next_target = self.get_next_target()
             if next_target is not None:
-                self.controller.move_to_floor(next_target)
+                controller.move_to_floor(next_target)
+            self._needs_replan = (controller.target_floor is None and
+                                  controller.direction != Direction.IDLE)
         
         # Execute step
-        return self.step()
+        return self.step(now)
+    
+    def is_idle(self) -> bool:
+        """Check if the elevator is parked with closed doors and nothing queued."""
+        controller = self.controller
+        queue_manager = self.queue_manager
+        return (controller.direction == Direction.IDLE and
+                controller.door_state == DoorState.CLOSED and
+                not self.emergency_handler.emergency_mode and
+                not queue_manager.has_emergency_requests() and
+                not queue_manager.has_normal_requests() and
+                not queue_manager.has_paused_requests())
     
     def pause(self) -> None:
         """Pause the simulation."""
         self.is_paused = True
+        self._invalidate_status()
     
     def resume(self) -> None:
         """Resume the simulation."""
         self.is_paused = False
+        self._invalidate_status()
     
     def toggle_pause(self) -> bool:
         """Toggle pause state. Returns new pause state."""
         self.is_paused = not self.is_paused
+        self._invalidate_status()
         return self.is_paused
     
     def set_speed(self, multiplier: float) -> None:
         """Set simulation speed multiplier."""
-        self.speed_multiplier = max(0.1, min(3.0, multiplier))
+        if multiplier < 0.1:
+            multiplier = 0.1
+        elif multiplier > 3.0:
+            multiplier = 3.0
+        self.speed_multiplier = multiplier
+        self.floors_per_step = int(multiplier) if multiplier >= 1.0 else 1
+        self._invalidate_status()
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current status for display."""
-        return {
+        """
+        Get current status for display.
+        The dict is cached until the state changes; treat it as read-only.
+        """
+        if self._status_cache is not None:
+            return self._status_cache
+        self._status_cache = {
             'floor': self.controller.get_current_floor(),
-            'direction': str(self.controller.get_direction()),
+            'direction': _DIRECTION_NAMES[self.controller.get_direction()],
             'direction_enum': self.controller.get_direction(),
-            'door_state': str(self.controller.get_door_state()),
+            'door_state': _DOOR_STATE_NAMES[self.controller.get_door_state()],
             'emergency_mode': self.emergency_handler.is_emergency_mode(),
             'has_emergency': self.queue_manager.has_emergency_requests(),
             'emergency_count': len(self.queue_manager.emergency_requests),
@@ -323,10 +517,38 @@ class ElevatorSystem:
             'max_capacity': self.controller.stats.max_capacity,
             'target_floor': self.controller.target_floor
         }
+        return self._status_cache
+    
+    def get_display_status(self) -> ElevatorStatus:
+        """
+        Get the status the UI redraws from, as a NamedTuple.
+        Cached until the state changes, like get_status().
+        """
+        if self._display_status_cache is not None:
+            return self._display_status_cache
+        controller = self.controller
+        queue_stats = self.queue_manager.stats
+        self._display_status_cache = ElevatorStatus(
+            floor=controller.current_floor,
+            direction=_DIRECTION_NAMES[controller.direction],
+            direction_enum=controller.direction,
+            door_state=controller.door_state,
+            emergency_mode=self.emergency_handler.emergency_mode,
+            emergency_count=len(self.queue_manager.emergency_requests),
+            stats={
+                'floors_traveled': controller.stats.total_floors_traveled,
+                'requests_served': queue_stats.total_requests_served,
+                'normal_served': queue_stats.normal_requests_served,
+                'emergency_served': queue_stats.emergency_requests_served,
+                'average_wait': queue_stats.average_wait_time,
+            },
+            pending_requests=self.queue_manager.get_pending_requests_info()
+        )
+        return self._display_status_cache
     
     def get_detailed_status(self) -> Dict[str, Any]:
         """Get detailed status including statistics and pending requests."""
-        status = self.get_status()
+        status = dict(self.get_status())
         status.update({
             'stats': {
                 'floors_traveled': self.controller.stats.total_floors_traveled,
@@ -340,6 +562,6 @@ class ElevatorSystem:
                 self.controller.get_current_floor(),
                 self.controller.get_direction()
             ) if self.emergency_handler.is_emergency_mode() else None,
-            'recent_events': self.event_log[-10:] if self.event_log else []
+            'recent_events': list(islice(self.event_log, max(0, len(self.event_log) - 10), None))
         })
         return status
@@ -1,16 +1,41 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 import math
+from functools import partial
 from elevator_system import ElevatorSystem
 from constants import Direction, DoorState, Colors
 
 
+# Unit (cos, sin) offsets along a quarter circle, 0..90 degrees
+_CORNER_ARC = tuple((math.cos(i * math.pi / 8), math.sin(i * math.pi / 8)) for i in range(5))
+_ROUND_RECT_CACHE = {}
+
+
+def _round_rect_points(x1, y1, x2, y2, r):
+    """Flat polygon coordinates tracing a rounded rectangle, cached per geometry."""
+    key = (x1, y1, x2, y2, r)
+    points = _ROUND_RECT_CACHE.get(key)
+    if points is None:
+        points = []
+        # Clockwise from the top edge: top-right, bottom-right, bottom-left, top-left
+        for c, s in reversed(_CORNER_ARC):
+            points += (x2 - r + r * c, y1 + r - r * s)
+        for c, s in _CORNER_ARC:
+            points += (x2 - r + r * c, y2 - r + r * s)
+        for c, s in reversed(_CORNER_ARC):
+            points += (x1 + r - r * c, y2 - r + r * s)
+        for c, s in _CORNER_ARC:
+            points += (x1 + r - r * c, y1 + r - r * s)
+        points = _ROUND_RECT_CACHE[key] = tuple(points)
+    return points
+
+
 class ModernButton(tk.Canvas):
     """Custom modern button with hover effects and rounded corners."""
     
     def __init__(self, parent, text="", command=None, width=60, height=35, 
                  bg_color=Colors.PRIMARY, hover_color=Colors.PRIMARY_HOVER, 
-                 text_color=Colors.TEXT, font_size=10, **kwargs):
+                 text_color=Colors.TEXT, font_size=10, font=None, **kwargs):
         super().__init__(parent, width=width, height=height, 
                         bg=parent.cget('bg'), highlightthickness=0, **kwargs)
         
@@ -21,41 +46,51 @@ class ModernButton(tk.Canvas):
         self.current_color = bg_color
         self.text = text
         self.font_size = font_size
+        # Pass a shared tkfont.Font to avoid Tk resolving a tuple on every draw
+        self.font = font if font is not None else ('Segoe UI', font_size, 'bold')
         self.is_pressed = False
         
+        # Canvas item ids, created by draw()
+        self._rect_id = None
+        self._text_id = None
         self.draw()
         
         self.bind('<Enter>', self.on_enter)
         self.bind('<Leave>', self.on_leave)
         self.bind('<Button-1>', self.on_press)
         self.bind('<ButtonRelease-1>', self.on_release)
+        self.bind('<Configure>', self.on_configure)
     
     def draw(self):
+        """Build the button items. Only needed when the geometry changes."""
         self.delete('all')
         w, h = self.winfo_reqwidth(), self.winfo_reqheight()
         r = 8  # Corner radius
         
         # Draw rounded rectangle
-        self.create_rounded_rect(2, 2, w-2, h-2, r, fill=self.current_color, outline='')
+        self._rect_id = self.create_rounded_rect(2, 2, w-2, h-2, r,
+                                                 fill=self.current_color, outline='')
         
         # Draw text
-        self.create_text(w//2, h//2, text=self.text, fill=self.text_color,
-                        font=('Segoe UI', self.font_size, 'bold'))
+        self._text_id = self.create_text(w//2, h//2, text=self.text, fill=self.text_color,
+                                         font=self.font)
+    
+    def set_color(self, color):
+        """Recolor the button background in place."""
+        self.current_color = color
+        self.itemconfig(self._rect_id, fill=color)
     
     def create_rounded_rect(self, x1, y1, x2, y2, r, **kwargs):
-        points = [
-            x1+r, y1, x2-r, y1, x2, y1, x2, y1+r,
-            x2, y2-r, x2, y2, x2-r, y2, x1+r, y2,
-            x1, y2, x1, y2-r, x1, y1+r, x1, y1
-        ]
-        return self.create_polygon(points, smooth=True, **kwargs)
+        # Corners are sampled arcs, so Tk does not need to smooth the outline
+        return self.create_polygon(_round_rect_points(x1, y1, x2, y2, r), **kwargs)
     
     def on_enter(self, event):
-        self.current_color = self.hover_color
-        self.draw()
+        self.set_color(self.hover_color)
     
     def on_leave(self, event):
-        self.current_color = self.bg_color
+        self.set_color(self.bg_color)
+    
+    def on_configure(self, event):
         self.draw()
     
     def on_press(self, event):
@@ -70,29 +105,82 @@ class ModernButton(tk.Canvas):
 class ElevatorShaftVisualization(tk.Canvas):
     """Visual representation of the elevator shaft with animated elevator car."""
     
-    def __init__(self, parent, num_floors=10, width=120, **kwargs):
+    def __init__(self, parent, num_floors=10, width=120,
+                 label_font=('Segoe UI', 9, 'bold'), **kwargs):
         height = num_floors * 50 + 60
         super().__init__(parent, width=width, height=height, 
                         bg=Colors.ELEVATOR_SHAFT, highlightthickness=0, **kwargs)
         
+        # Cached canvas width (winfo_* is a Tcl round-trip); see on_configure
+        self._w = self.winfo_reqwidth()
+        
         self.num_floors = num_floors
+        self.label_font = label_font
         self.floor_height = 50
         self.elevator_width = 60
         self.elevator_height = 40
         
+        # Floor -> Y coordinate table (index 0 unused)
+        self._floor_y = [None] + [self._floor_to_y(f) for f in range(1, num_floors + 1)]
+        
         self.current_floor = 1
-        self.target_y = self._floor_to_y(1)
+        self.target_y = self._floor_y[1]
         self.current_y = self.target_y
         self.door_state = DoorState.CLOSED
         self.is_emergency = False
         
         self.animation_speed = 3
         self.glow_phase = 0
+        # Colors read by draw_elevator, bound once instead of per frame;
+        # car (fill, outline) is indexed by is_emergency
+        self._car_colors = ((Colors.PRIMARY, Colors.PRIMARY_GLOW),
+                            (Colors.DANGER, Colors.DANGER_GLOW))
+        self._up_color = Colors.ELEVATOR_UP
+        self._down_color = Colors.ELEVATOR_DOWN
+        
+        # One prebaked halo image per quantized glow phase
+        self._glow_images = [self._make_glow_image(colors) for colors in self._build_glow_lut()]
         
         self.draw_static()
+        self._create_elevator_items()
+        self._last_state = None
+        self._last_update = None
+        self._anim_running = False
         self.draw_elevator()
+        self.bind('<Configure>', self.on_configure)
+        
+        # Pause animation while the window is minimized/hidden
+        self._visible = True
+        toplevel = self.winfo_toplevel()
+        toplevel.bind('<Map>', self.on_map, add='+')
+        toplevel.bind('<Unmap>', self.on_unmap, add='+')
         self.animate()
     
+    def on_map(self, event):
+        """Window shown again: resume animating."""
+        if event.widget is self.winfo_toplevel():
+            self._visible = True
+            self._start_animation()
+    
+    def on_unmap(self, event):
+        """Window minimized/hidden: let the animation loop stop."""
+        if event.widget is self.winfo_toplevel():
+            self._visible = False
+    
+    def _start_animation(self):
+        """Restart the animation loop if it went quiet."""
+        if not self._anim_running and self._visible:
+            self._anim_running = True
+            self.after(16, self.animate)
+    
+    def on_configure(self, event):
+        """Redraw at the new width when the canvas is resized."""
+        if event.width != self._w:
+            self._w = event.width
+            self.draw_static()
+            self._last_state = None  # Every item moves horizontally
+            self.draw_elevator()
+    
     def _floor_to_y(self, floor):
         """Convert floor number to Y coordinate."""
         return (self.num_floors - floor) * self.floor_height + 30
@@ -101,113 +189,177 @@ class ElevatorShaftVisualization(tk.Canvas):
         """Draw static elements (floor markers, labels)."""
         self.delete('static')
         
-        w = self.winfo_reqwidth()
+        w = self._w
+        
+        x1, y1, x2, y2 = 20, 10, w-20, self.num_floors * self.floor_height + 50
+        
+        # Border and floor lines are baked into one image; the shaft fill is
+        # the canvas background, so every other pixel stays transparent
+        self._static_image = image = tk.PhotoImage(master=self, width=w, height=y2 + 1)
         
-        # Draw shaft border with gradient effect
-        self.create_rectangle(20, 10, w-20, self.num_floors * self.floor_height + 50,
-                             fill=Colors.ELEVATOR_SHAFT, outline=Colors.BORDER, 
-                             width=2, tags='static')
+        # Shaft border (2 px, centered on the edge like a canvas outline)
+        image.put(Colors.BORDER, to=(x1 - 1, y1 - 1, x2 + 1, y1 + 1))
+        image.put(Colors.BORDER, to=(x1 - 1, y2 - 1, x2 + 1, y2 + 1))
+        image.put(Colors.BORDER, to=(x1 - 1, y1 - 1, x1 + 1, y2 + 1))
+        image.put(Colors.BORDER, to=(x2 - 1, y1 - 1, x2 + 1, y2 + 1))
         
-        # Draw floor lines and labels
+        # Floor lines
         for floor in range(1, self.num_floors + 1):
-            y = self._floor_to_y(floor) + self.elevator_height // 2
-            
-            # Floor line
-            self.create_line(22, y + 15, w-22, y + 15, 
-                           fill=Colors.FLOOR_MARKER, width=1, tags='static')
-            
-            # Floor number
+            y = self._floor_y[floor] + self.elevator_height // 2
+            image.put(Colors.FLOOR_MARKER, to=(22, y + 15, w-22, y + 16))
+        
+        self.create_image(0, 0, image=image, anchor='nw', tags='static')
+        
+        # Floor numbers stay text items on top of the image
+        for floor in range(1, self.num_floors + 1):
+            y = self._floor_y[floor] + self.elevator_height // 2
             self.create_text(w - 8, y, text=str(floor), 
                            fill=Colors.TEXT_SECONDARY, 
-                           font=('Segoe UI', 9, 'bold'), 
+                           font=self.label_font, 
                            anchor='e', tags='static')
+        
+        # Keep the shaft behind the (persistent) elevator items after a redraw
+        self.tag_lower('static')
+    
+    _GLOW_STEPS = 64
+    _TWO_PI = 2 * math.pi
+    # Glow phase -> LUT index scale, hoisted out of the per-frame path
+    _GLOW_SCALE = _GLOW_STEPS / _TWO_PI
+    _GLOW_PAD = 6  # Outermost glow layer extends 3*2 px beyond the car
+    
+    def _build_glow_lut(self):
+        """Precompute the three glow layer colors for each quantized glow phase."""
+        lut = []
+        for step in range(self._GLOW_STEPS):
+            glow_intensity = (math.sin(self._TWO_PI * step / self._GLOW_STEPS) + 1) / 2
+            glow_color = self._blend_color(Colors.DANGER, Colors.EMERGENCY_GLOW, glow_intensity)
+            lut.append(tuple(self._adjust_brightness(glow_color, 0.3 + (3-i) * 0.2)
+                             for i in range(3, 0, -1)))
+        return lut
+    
+    def _make_glow_image(self, layer_colors):
+        """Bake the three nested glow layers (outermost first) into one image."""
+        pad = self._GLOW_PAD
+        ew, eh = self.elevator_width, self.elevator_height
+        image = tk.PhotoImage(master=self, width=ew + 2*pad, height=eh + 2*pad)
+        for i, color in zip(range(3, 0, -1), layer_colors):
+            inset = pad - i*2
+            image.put(color, to=(inset, inset, ew + 2*pad - inset, eh + 2*pad - inset))
+        return image
+    
+    def _create_elevator_items(self):
+        """Create the elevator car items once; draw_elevator only moves/recolors them."""
+        # Glow halo image, then car, doors and direction indicator
+        self._glow_id = self.create_image(0, 0, anchor='nw', state='hidden', tags='elevator')
+        self._car_id = self.create_rectangle(0, 0, 0, 0, width=2, tags='elevator')
+        self._left_door_id = self.create_rectangle(0, 0, 0, 0, fill=Colors.CARD_BG,
+                                                   outline='', tags='elevator')
+        self._right_door_id = self.create_rectangle(0, 0, 0, 0, fill=Colors.CARD_BG,
+                                                    outline='', tags='elevator')
+        self._indicator_id = self.create_polygon(0, 0, 0, 0, 0, 0, state='hidden',
+                                                 tags='elevator')
     
     def draw_elevator(self):
-        """Draw the elevator car."""
-        self.delete('elevator')
-        
-        w = self.winfo_reqwidth()
+        """Draw the elevator car, touching only the items whose inputs changed."""
+        w = self._w
         x = (w - self.elevator_width) // 2
         y = self.current_y
+        direction, door_state, is_emergency = self._direction, self.door_state, self.is_emergency
+        
+        # What was drawn last time; None forces a full redraw
+        last_y, last_direction, last_door_state, last_emergency = (
+            self._last_state or (None, None, None, None))
+        moved = y != last_y
         
         # Glow effect for emergency mode
-        if self.is_emergency:
-            glow_intensity = (math.sin(self.glow_phase) + 1) / 2
-            glow_color = self._blend_color(Colors.DANGER, Colors.EMERGENCY_GLOW, glow_intensity)
+        if is_emergency:
+            step = int(self.glow_phase * self._GLOW_SCALE) & (self._GLOW_STEPS - 1)
             
             # Draw glow
-            for i in range(3, 0, -1):
-                alpha_color = self._adjust_brightness(glow_color, 0.3 + (3-i) * 0.2)
-                self.create_rectangle(
-                    x - i*2, y - i*2, 
-                    x + self.elevator_width + i*2, y + self.elevator_height + i*2,
-                    fill=alpha_color, outline='', tags='elevator'
-                )
+            self.coords(self._glow_id, x - self._GLOW_PAD, y - self._GLOW_PAD)
+            self.itemconfig(self._glow_id, image=self._glow_images[step], state='normal')
+        elif is_emergency != last_emergency:
+            self.itemconfig(self._glow_id, state='hidden')
         
         # Elevator car body
-        car_color = Colors.DANGER if self.is_emergency else Colors.PRIMARY
-        self.create_rectangle(x, y, x + self.elevator_width, y + self.elevator_height,
-                             fill=car_color, outline=Colors.PRIMARY_GLOW if not self.is_emergency else Colors.DANGER_GLOW, 
-                             width=2, tags='elevator')
+        if moved:
+            self.coords(self._car_id, x, y, x + self.elevator_width, y + self.elevator_height)
+        if is_emergency != last_emergency:
+            car_color, car_outline = self._car_colors[is_emergency]
+            self.itemconfig(self._car_id, fill=car_color, outline=car_outline)
         
         # Elevator doors
-        door_gap = 2 if self.door_state == DoorState.OPEN else 0
-        door_width = (self.elevator_width - 8) // 2 - door_gap
-        
-        # Left door
-        self.create_rectangle(x + 4, y + 4, 
-                             x + 4 + door_width - door_gap, y + self.elevator_height - 4,
-                             fill=Colors.CARD_BG, outline='', tags='elevator')
-        
-        # Right door
-        self.create_rectangle(x + self.elevator_width - 4 - door_width + door_gap, y + 4,
-                             x + self.elevator_width - 4, y + self.elevator_height - 4,
-                             fill=Colors.CARD_BG, outline='', tags='elevator')
+        if moved or door_state != last_door_state:
+            door_gap = 2 if door_state == DoorState.OPEN else 0
+            door_width = (self.elevator_width - 8) // 2 - door_gap
+            
+            # Left door
+            self.coords(self._left_door_id, x + 4, y + 4, 
+                        x + 4 + door_width - door_gap, y + self.elevator_height - 4)
+            
+            # Right door
+            self.coords(self._right_door_id, x + self.elevator_width - 4 - door_width + door_gap, y + 4,
+                        x + self.elevator_width - 4, y + self.elevator_height - 4)
         
         # Direction indicator
-        center_x = x + self.elevator_width // 2
-        indicator_y = y - 8
-        
-        if self._direction == Direction.UP:
-            self.create_polygon(center_x - 5, indicator_y + 5, 
-                              center_x, indicator_y - 3,
-                              center_x + 5, indicator_y + 5,
-                              fill=Colors.ELEVATOR_UP, tags='elevator')
-        elif self._direction == Direction.DOWN:
-            self.create_polygon(center_x - 5, indicator_y - 3, 
-                              center_x, indicator_y + 5,
-                              center_x + 5, indicator_y - 3,
-                              fill=Colors.ELEVATOR_DOWN, tags='elevator')
+        if moved or direction != last_direction:
+            center_x = x + self.elevator_width // 2
+            indicator_y = y - 8
+            
+            if direction == Direction.UP:
+                self.coords(self._indicator_id, center_x - 5, indicator_y + 5, 
+                            center_x, indicator_y - 3,
+                            center_x + 5, indicator_y + 5)
+                self.itemconfig(self._indicator_id, fill=self._up_color, state='normal')
+            elif direction == Direction.DOWN:
+                self.coords(self._indicator_id, center_x - 5, indicator_y - 3, 
+                            center_x, indicator_y + 5,
+                            center_x + 5, indicator_y - 3)
+                self.itemconfig(self._indicator_id, fill=self._down_color, state='normal')
+            else:
+                self.itemconfig(self._indicator_id, state='hidden')
+        
+        self._last_state = (y, direction, door_state, is_emergency)
     
     def _blend_color(self, color1, color2, ratio):
         """Blend two hex colors."""
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        return f'#{r:02x}{g:02x}{b:02x}'
+        # Parse each color once as packed 0xRRGGBB and split with shifts
+        c1, c2 = int(color1[1:], 16), int(color2[1:], 16)
+        r1, g1, b1 = (c1 >> 16) & 255, (c1 >> 8) & 255, c1 & 255
+        r2, g2, b2 = (c2 >> 16) & 255, (c2 >> 8) & 255, c2 & 255
+        v = ((int(r1 + (r2 - r1) * ratio) << 16)
+             | (int(g1 + (g2 - g1) * ratio) << 8)
+             | int(b1 + (b2 - b1) * ratio))
+        return f'#{v:06x}'
     
     def _adjust_brightness(self, color, factor):
         """Adjust color brightness."""
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        r = min(255, int(r * factor))
-        g = min(255, int(g * factor))
-        b = min(255, int(b * factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+        c = int(color[1:], 16)
+        r = min(255, int(((c >> 16) & 255) * factor))
+        g = min(255, int(((c >> 8) & 255) * factor))
+        b = min(255, int((c & 255) * factor))
+        return f'#{(r << 16) | (g << 8) | b:06x}'
     
     _direction = Direction.IDLE
     
     def update_state(self, floor, direction, door_state, is_emergency):
         """Update elevator state."""
-        self.target_y = self._floor_to_y(floor)
+        # Nothing to do if the state is unchanged and the car has settled
+        new_state = (floor, direction, door_state, is_emergency)
+        if new_state == self._last_update and abs(self.current_y - self.target_y) <= 1:
+            return
+        self._last_update = new_state
+        
+        self.target_y = self._floor_y[floor]
         self._direction = direction
         self.door_state = door_state
         self.is_emergency = is_emergency
         self.current_floor = floor
+        
+        self._start_animation()
     
     def animate(self):
-        """Animation loop."""
+        """Animation loop, running only while there is something to animate."""
         # Smooth movement
         if abs(self.current_y - self.target_y) > 1:
             diff = self.target_y - self.current_y
@@ -217,17 +369,30 @@ class ElevatorShaftVisualization(tk.Canvas):
         
         # Glow animation
         self.glow_phase += 0.15
-        if self.glow_phase > math.pi * 2:
-            self.glow_phase = 0
-        
-        self.draw_elevator()
-        self.after(16, self.animate)  # ~60 FPS
+        if self.glow_phase > self._TWO_PI:
+            self.glow_phase -= self._TWO_PI  # Wrap without losing the remainder
+        
+        # Only touch the canvas when something visible changed; the glow
+        # pulses every frame while in emergency mode
+        state = (self.current_y, self._direction, self.door_state, self.is_emergency)
+        if self.is_emergency or state != self._last_state:
+            self.draw_elevator()
+        
+        # Keep ticking only while visible and the car is moving or glowing;
+        # update_state and on_map restart the loop
+        if self._visible and (self.current_y != self.target_y or self.is_emergency):
+            self._anim_running = True
+            self.after(16, self.animate)  # ~60 FPS
+        else:
+            self._anim_running = False
 
 
 class StatsCard(tk.Frame):
     """A card displaying a statistic with label and value."""
     
-    def __init__(self, parent, label, value="0", icon="📊", **kwargs):
+    def __init__(self, parent, label, value="0", icon="📊",
+                 icon_font=('Segoe UI', 10), label_font=('Segoe UI', 8),
+                 value_font=('Segoe UI', 12, 'bold'), **kwargs):
         super().__init__(parent, bg=Colors.CARD_BG, **kwargs)
         
         self.configure(highlightbackground=Colors.BORDER, highlightthickness=1)
@@ -237,102 +402,106 @@ class StatsCard(tk.Frame):
         content.pack(fill=tk.X, padx=8, pady=6)
         
         # Icon
-        tk.Label(content, text=icon, font=('Segoe UI', 10), 
+        tk.Label(content, text=icon, font=icon_font, 
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(side=tk.LEFT)
         
         # Label
-        tk.Label(content, text=label, font=('Segoe UI', 8), 
+        tk.Label(content, text=label, font=label_font, 
                 bg=Colors.CARD_BG, fg=Colors.TEXT_SECONDARY).pack(side=tk.LEFT, padx=(4, 0))
         
         # Value (right aligned)
-        self.value_label = tk.Label(content, text=value, font=('Segoe UI', 12, 'bold'),
+        self.value_label = tk.Label(content, text=value, font=value_font,
                                    bg=Colors.CARD_BG, fg=Colors.PRIMARY_GLOW)
         self.value_label.pack(side=tk.RIGHT)
+        self._value_text = value
+        self._value_color = Colors.PRIMARY_GLOW
     
     def set_value(self, value, color=None):
-        self.value_label.config(text=str(value))
-        if color:
+        text = str(value)
+        if text != self._value_text:
+            self._value_text = text
+            self.value_label.config(text=text)
+        if color and color != self._value_color:
+            self._value_color = color
             self.value_label.config(fg=color)
 
 
 class PendingRequestsPanel(tk.Frame):
     """Panel showing all pending requests in real-time."""
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, title_font=('Segoe UI', 11, 'bold'),
+                 font=('Segoe UI', 9), bold_font=('Segoe UI', 9, 'bold'), **kwargs):
         super().__init__(parent, bg=Colors.CARD_BG, **kwargs)
         
         self.configure(highlightbackground=Colors.BORDER, highlightthickness=1)
         
         # Title
-        tk.Label(self, text="📋 Pending Requests", font=('Segoe UI', 11, 'bold'),
+        tk.Label(self, text="📋 Pending Requests", font=title_font,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(anchor=tk.W, padx=10, pady=(10, 5))
         
-        # Requests list
-        self.list_frame = tk.Frame(self, bg=Colors.CARD_BG)
-        self.list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-        
-        self.request_labels = []
+        # Requests list: a single read-only Text, one colored line per request
+        self.text = tk.Text(self, height=1, wrap=tk.NONE,
+                            font=font,
+                            bg=Colors.CARD_BG, fg=Colors.TEXT,
+                            relief='flat', borderwidth=0, highlightthickness=0,
+                            cursor='arrow', state='disabled')
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.text_height = 1
+        self._shown_lines = None
+        
+        self.text.tag_configure('internal', foreground=Colors.PRIMARY_GLOW)
+        self.text.tag_configure('up', foreground=Colors.ELEVATOR_UP)
+        self.text.tag_configure('down', foreground=Colors.ELEVATOR_DOWN)
+        self.text.tag_configure('emergency', foreground=Colors.DANGER,
+                                font=bold_font)
+        self.text.tag_configure('paused', foreground=Colors.WARNING)
+        self.text.tag_configure('empty', foreground=Colors.TEXT_MUTED)
     
     def update_requests(self, pending_info):
         """Update the displayed requests."""
-        # Clear existing
-        for label in self.request_labels:
-            label.destroy()
-        self.request_labels = []
-        
-        row = 0
+        lines = []
         
         # Internal requests
         for req in pending_info.get('internal', []):
-            label = tk.Label(self.list_frame, 
-                           text=f"🔵 Internal → Floor {req.floor}",
-                           font=('Segoe UI', 9), bg=Colors.CARD_BG, fg=Colors.PRIMARY_GLOW)
-            label.grid(row=row, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
-            row += 1
+            lines.append((f"🔵 Internal → Floor {req.floor}", 'internal'))
         
         # External UP requests
         for req in pending_info.get('external_up', []):
-            label = tk.Label(self.list_frame, 
-                           text=f"🟢 Floor {req.floor} ↑",
-                           font=('Segoe UI', 9), bg=Colors.CARD_BG, fg=Colors.ELEVATOR_UP)
-            label.grid(row=row, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
-            row += 1
+            lines.append((f"🟢 Floor {req.floor} ↑", 'up'))
         
         # External DOWN requests
         for req in pending_info.get('external_down', []):
-            label = tk.Label(self.list_frame, 
-                           text=f"🔵 Floor {req.floor} ↓",
-                           font=('Segoe UI', 9), bg=Colors.CARD_BG, fg=Colors.ELEVATOR_DOWN)
-            label.grid(row=row, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
-            row += 1
+            lines.append((f"🔵 Floor {req.floor} ↓", 'down'))
         
         # Emergency requests
         for req in pending_info.get('emergency', []):
-            label = tk.Label(self.list_frame, 
-                           text=f"🚨 Emergency: Floor {req.floor} {req.direction}",
-                           font=('Segoe UI', 9, 'bold'), bg=Colors.CARD_BG, fg=Colors.DANGER)
-            label.grid(row=row, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
-            row += 1
+            lines.append((f"🚨 Emergency: Floor {req.floor} {req.direction}", 'emergency'))
         
         # Paused indicator
         for req in pending_info.get('paused', []):
-            label = tk.Label(self.list_frame, 
-                           text=f"⏸️ {req.direction}",
-                           font=('Segoe UI', 9), bg=Colors.CARD_BG, fg=Colors.WARNING)
-            label.grid(row=row, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
-            row += 1
-        
-        if row == 0:
-            label = tk.Label(self.list_frame, 
-                           text="No pending requests",
-                           font=('Segoe UI', 9), bg=Colors.CARD_BG, fg=Colors.TEXT_MUTED)
-            label.grid(row=0, column=0, sticky='w', pady=1)
-            self.request_labels.append(label)
+            lines.append((f"⏸️ {req.direction}", 'paused'))
+        
+        if not lines:
+            lines.append(("No pending requests", 'empty'))
+        
+        if lines == self._shown_lines:
+            return
+        self._shown_lines = lines
+        
+        # Rewrite the whole list with a single insert of (text, tag) pairs
+        chunks = []
+        for line, tag in lines:
+            chunks += (line + "\n", tag)
+        text = self.text
+        text.configure(state='normal')
+        text.delete('1.0', tk.END)
+        text.insert(tk.END, *chunks)
+        text.configure(state='disabled')
+        
+        # Grow/shrink with the list, like the old per-request labels did
+        if len(lines) != self.text_height:
+            self.text_height = len(lines)
+            text.configure(height=self.text_height)
 
 
 class ElevatorUI:
@@ -348,18 +517,72 @@ class ElevatorUI:
         self.root.minsize(1200, 700)
         
         self.num_floors = num_floors
+        # Floor choices shared by every emergency row's comboboxes
+        self._floor_labels = tuple(str(i) for i in range(1, num_floors + 1))
         self.elevator = ElevatorSystem(num_floors, start_floor, start_direction)
         
         # UI update interval (milliseconds)
         self.base_interval = 400
         self.update_interval = self.base_interval
+        # Tick interval once the elevator has been idle for two ticks in a row;
+        # well above base_interval so idling actually slows the loop (the
+        # request paths call _wake(), so new work never waits for it)
+        self.idle_interval = 1000
+        self._sim_after_id = None
+        self._was_idle = False
+        self._sleeping = False
+        
+        # Display redraws are decoupled from simulation steps (see _request_redraw)
+        self._needs_redraw = False
+        self._render_pending = False
+        self._last_status = None
+        # Last values shown by update_display's widgets (None = never drawn)
+        self._last_floor = None
+        self._last_direction = None
+        self._last_emergency = None
+        self._last_shaft_state = None
+        
+        # Log lines are buffered and flushed together (see log)
+        self._log_buffer = []
+        self._log_flush_pending = False
+        
+        # Activity Log line cap: once over max_log_lines, trim back to log_trim_lines
+        self.max_log_lines = 500
+        self.log_trim_lines = 400
+        self._log_line_count = 0
+        self._see_counter = 0
+        # Set while flushed lines are not scrolled into view yet; a deferred
+        # scroll (_scroll_log) catches them up once the log goes quiet
+        self._log_unscrolled = False
+        self._log_scroll_pending = False
+        
+        # Slider changes are snapped and coalesced (see on_speed_change);
+        # _pending_speed is the latest requested speed
+        self._speed_pending = False
+        self._pending_speed = 1.0
+        # Speed slider range; both ends sit on the 0.25x snapping grid
+        self.min_speed = 0.25
+        self.max_speed = 3.0
         
         self.setup_styles()
         self.setup_ui()
         self.start_simulation()
     
     def setup_styles(self):
-        """Configure ttk styles."""
+        """Configure ttk styles and the shared fonts."""
+        # Font objects are resolved by Tk once and shared by every widget
+        self.F_SMALL = tkfont.Font(root=self.root, family='Segoe UI', size=8)
+        self.F_NORMAL = tkfont.Font(root=self.root, family='Segoe UI', size=9)
+        self.F_BOLD = tkfont.Font(root=self.root, family='Segoe UI', size=9, weight='bold')
+        self.F_BODY = tkfont.Font(root=self.root, family='Segoe UI', size=10)
+        self.F_BODY_BOLD = tkfont.Font(root=self.root, family='Segoe UI', size=10, weight='bold')
+        self.F_HEADING = tkfont.Font(root=self.root, family='Segoe UI', size=11, weight='bold')
+        self.F_ICON = tkfont.Font(root=self.root, family='Segoe UI', size=12)
+        self.F_BUTTON = tkfont.Font(root=self.root, family='Segoe UI', size=12, weight='bold')
+        self.F_ARROW = tkfont.Font(root=self.root, family='Segoe UI', size=14)
+        self.F_FLOOR_BUTTON = tkfont.Font(root=self.root, family='Segoe UI', size=14, weight='bold')
+        self.F_STATUS = tkfont.Font(root=self.root, family='Segoe UI', size=18, weight='bold')
+        
         style = ttk.Style()
         style.theme_use('clam')
         
@@ -441,7 +664,7 @@ class ElevatorUI:
         tk.Label(title_text, text="Emergency Elevator Control System",
                 font=('Segoe UI', 20, 'bold'), bg=Colors.BG, fg=Colors.TEXT).pack(anchor=tk.W)
         tk.Label(title_text, text="Advanced Scheduling with Priority Queue",
-                font=('Segoe UI', 10), bg=Colors.BG, fg=Colors.TEXT_SECONDARY).pack(anchor=tk.W)
+                font=self.F_BODY, bg=Colors.BG, fg=Colors.TEXT_SECONDARY).pack(anchor=tk.W)
         
         # Status indicators
         status_frame = tk.Frame(header, bg=Colors.BG)
@@ -451,7 +674,7 @@ class ElevatorUI:
         floor_card = tk.Frame(status_frame, bg=Colors.CARD_BG, 
                              highlightbackground=Colors.BORDER, highlightthickness=1)
         floor_card.pack(side=tk.LEFT, padx=5)
-        tk.Label(floor_card, text="FLOOR", font=('Segoe UI', 8),
+        tk.Label(floor_card, text="FLOOR", font=self.F_SMALL,
                 bg=Colors.CARD_BG, fg=Colors.TEXT_SECONDARY).pack(padx=15, pady=(5, 0))
         self.floor_label = tk.Label(floor_card, text="3", font=('Segoe UI', 24, 'bold'),
                                    bg=Colors.CARD_BG, fg=Colors.PRIMARY_GLOW)
@@ -461,9 +684,9 @@ class ElevatorUI:
         dir_card = tk.Frame(status_frame, bg=Colors.CARD_BG,
                            highlightbackground=Colors.BORDER, highlightthickness=1)
         dir_card.pack(side=tk.LEFT, padx=5)
-        tk.Label(dir_card, text="DIRECTION", font=('Segoe UI', 8),
+        tk.Label(dir_card, text="DIRECTION", font=self.F_SMALL,
                 bg=Colors.CARD_BG, fg=Colors.TEXT_SECONDARY).pack(padx=15, pady=(5, 0))
-        self.direction_label = tk.Label(dir_card, text="UP ↑", font=('Segoe UI', 18, 'bold'),
+        self.direction_label = tk.Label(dir_card, text="UP ↑", font=self.F_STATUS,
                                        bg=Colors.CARD_BG, fg=Colors.ELEVATOR_UP)
         self.direction_label.pack(padx=15, pady=(0, 5))
         
@@ -471,10 +694,10 @@ class ElevatorUI:
         self.emergency_card = tk.Frame(status_frame, bg=Colors.CARD_BG,
                                        highlightbackground=Colors.BORDER, highlightthickness=1)
         self.emergency_card.pack(side=tk.LEFT, padx=5)
-        tk.Label(self.emergency_card, text="EMERGENCY", font=('Segoe UI', 8),
+        tk.Label(self.emergency_card, text="EMERGENCY", font=self.F_SMALL,
                 bg=Colors.CARD_BG, fg=Colors.TEXT_SECONDARY).pack(padx=15, pady=(5, 0))
         self.emergency_label = tk.Label(self.emergency_card, text="OFF", 
-                                       font=('Segoe UI', 18, 'bold'),
+                                       font=self.F_STATUS,
                                        bg=Colors.CARD_BG, fg=Colors.TEXT_MUTED)
         self.emergency_label.pack(padx=15, pady=(0, 5))
     
@@ -484,10 +707,11 @@ class ElevatorUI:
                               highlightbackground=Colors.BORDER, highlightthickness=1)
         shaft_frame.pack(fill=tk.X, pady=(0, 10))
         
-        tk.Label(shaft_frame, text="Elevator Shaft", font=('Segoe UI', 11, 'bold'),
+        tk.Label(shaft_frame, text="Elevator Shaft", font=self.F_HEADING,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(anchor=tk.W, padx=10, pady=(10, 5))
         
-        self.shaft_viz = ElevatorShaftVisualization(shaft_frame, self.num_floors)
+        self.shaft_viz = ElevatorShaftVisualization(shaft_frame, self.num_floors,
+                                                   label_font=self.F_BOLD)
         self.shaft_viz.pack(padx=10, pady=(0, 10))
     
     def _create_stats_panel(self, parent):
@@ -495,10 +719,14 @@ class ElevatorUI:
         stats_frame = tk.Frame(parent, bg=Colors.BG)
         stats_frame.pack(fill=tk.X)
         
-        self.floors_stat = StatsCard(stats_frame, "Floors Traveled", "0", "🛗")
+        self.floors_stat = StatsCard(stats_frame, "Floors Traveled", "0", "🛗",
+                                     icon_font=self.F_BODY, label_font=self.F_SMALL,
+                                     value_font=self.F_BUTTON)
         self.floors_stat.pack(fill=tk.X, pady=(0, 5))
         
-        self.served_stat = StatsCard(stats_frame, "Requests Served", "0", "✅")
+        self.served_stat = StatsCard(stats_frame, "Requests Served", "0", "✅",
+                                     icon_font=self.F_BODY, label_font=self.F_SMALL,
+                                     value_font=self.F_BUTTON)
         self.served_stat.pack(fill=tk.X)
     
     def _create_control_panels(self, parent):
@@ -511,15 +739,15 @@ class ElevatorUI:
         speed_header = tk.Frame(speed_frame, bg=Colors.CARD_BG)
         speed_header.pack(fill=tk.X, padx=15, pady=10)
         
-        tk.Label(speed_header, text="⚡ Simulation Speed", font=('Segoe UI', 11, 'bold'),
+        tk.Label(speed_header, text="⚡ Simulation Speed", font=self.F_HEADING,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(side=tk.LEFT)
         
-        self.speed_label = tk.Label(speed_header, text="1.0x", font=('Segoe UI', 11),
+        self.speed_label = tk.Label(speed_header, text="1.00x", font=('Segoe UI', 11),
                                    bg=Colors.CARD_BG, fg=Colors.PRIMARY_GLOW)
         self.speed_label.pack(side=tk.RIGHT)
         
         self.speed_var = tk.DoubleVar(value=1.0)
-        speed_scale = ttk.Scale(speed_frame, from_=0.2, to=3.0, variable=self.speed_var,
+        speed_scale = ttk.Scale(speed_frame, from_=self.min_speed, to=self.max_speed, variable=self.speed_var,
                                orient=tk.HORIZONTAL, command=self.on_speed_change,
                                style='Custom.Horizontal.TScale')
         speed_scale.pack(fill=tk.X, padx=15, pady=(0, 5))
@@ -528,7 +756,7 @@ class ElevatorUI:
         pause_frame = tk.Frame(speed_frame, bg=Colors.CARD_BG)
         pause_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
         
-        self.pause_btn = tk.Button(pause_frame, text="⏸️ Pause", font=('Segoe UI', 10, 'bold'),
+        self.pause_btn = tk.Button(pause_frame, text="⏸️ Pause", font=self.F_BODY_BOLD,
                                   bg=Colors.WARNING, fg=Colors.BG, relief='flat',
                                   activebackground=Colors.WARNING, cursor='hand2',
                                   command=self.toggle_pause)
@@ -544,7 +772,7 @@ class ElevatorUI:
         external_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         tk.Label(external_frame, text="🔔 Call Elevator (External)", 
-                font=('Segoe UI', 11, 'bold'),
+                font=self.F_HEADING,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(anchor=tk.W, padx=15, pady=(10, 5))
         
         # Scrollable external buttons
@@ -563,21 +791,21 @@ class ElevatorUI:
             row = tk.Frame(ext_scrollable, bg=Colors.CARD_BG)
             row.pack(fill=tk.X, padx=10, pady=3)
             
-            tk.Label(row, text=f"F{floor}", font=('Segoe UI', 10, 'bold'),
+            tk.Label(row, text=f"F{floor}", font=self.F_BODY_BOLD,
                     bg=Colors.CARD_BG, fg=Colors.TEXT, width=4).pack(side=tk.LEFT)
             
-            up_btn = tk.Button(row, text="↑", font=('Segoe UI', 12, 'bold'),
+            up_btn = tk.Button(row, text="↑", font=self.F_BUTTON,
                               bg=Colors.ELEVATOR_UP, fg=Colors.BG,
                               width=3, relief='flat', cursor='hand2',
                               activebackground=Colors.SUCCESS,
-                              command=lambda f=floor: self.handle_external(f, "UP"))
+                              command=partial(self.handle_external, floor, "UP"))
             up_btn.pack(side=tk.LEFT, padx=3)
             
-            down_btn = tk.Button(row, text="↓", font=('Segoe UI', 12, 'bold'),
+            down_btn = tk.Button(row, text="↓", font=self.F_BUTTON,
                                 bg=Colors.ELEVATOR_DOWN, fg=Colors.BG,
                                 width=3, relief='flat', cursor='hand2',
                                 activebackground=Colors.PRIMARY,
-                                command=lambda f=floor: self.handle_external(f, "DOWN"))
+                                command=partial(self.handle_external, floor, "DOWN"))
             down_btn.pack(side=tk.LEFT, padx=3)
             
             self.external_buttons[floor] = (up_btn, down_btn)
@@ -591,7 +819,7 @@ class ElevatorUI:
         internal_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         tk.Label(internal_frame, text="🔢 Select Floor (Internal)", 
-                font=('Segoe UI', 11, 'bold'),
+                font=self.F_HEADING,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(anchor=tk.W, padx=15, pady=(10, 10))
         
         internal_grid = tk.Frame(internal_frame, bg=Colors.CARD_BG)
@@ -601,12 +829,12 @@ class ElevatorUI:
         for i, floor in enumerate(range(self.num_floors, 0, -1)):
             row, col = i // cols, i % cols
             btn = tk.Button(internal_grid, text=str(floor), 
-                           font=('Segoe UI', 14, 'bold'),
+                           font=self.F_FLOOR_BUTTON,
                            bg=Colors.CARD_BG_LIGHT, fg='#000000',
                            width=4, height=2, relief='flat', cursor='hand2',
                            activebackground=Colors.PRIMARY,
                            activeforeground='#000000',
-                           command=lambda f=floor: self.handle_internal(f))
+                           command=partial(self.handle_internal, floor))
             btn.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
         
         for i in range(cols):
@@ -622,11 +850,11 @@ class ElevatorUI:
         title_frame.pack(fill=tk.X, padx=15, pady=(15, 5))
         
         tk.Label(title_frame, text="Emergency Requests", 
-                font=('Segoe UI', 12, 'bold'),
+                font=self.F_BUTTON,
                 bg='#ffffff', fg='#000000').pack(anchor=tk.W)
         
         tk.Label(title_frame, text="From → To", 
-                font=('Segoe UI', 9),
+                font=self.F_NORMAL,
                 bg='#ffffff', fg='#666666').pack(anchor=tk.W, pady=(2, 0))
         
         # Scrollable table container
@@ -664,17 +892,18 @@ class ElevatorUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Bind mousewheel to canvas
+        # Bind mousewheel to canvas, only while the cursor is over it
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         # EXECUTE button at the bottom
         execute_frame = tk.Frame(emergency_frame, bg='#ffffff')
         execute_frame.pack(fill=tk.X, padx=15, pady=(0, 15))
         
         self.execute_btn = tk.Button(execute_frame, text="EXECUTE", 
-                                     font=('Segoe UI', 12, 'bold'),
+                                     font=self.F_BUTTON,
                                      bg=Colors.SUCCESS, fg='#000000',
                                      relief='flat', cursor='hand2',
                                      activebackground=Colors.SUCCESS_DARK,
@@ -683,7 +912,8 @@ class ElevatorUI:
     
     def _create_pending_panel(self, parent):
         """Create the pending requests panel."""
-        self.pending_panel = PendingRequestsPanel(parent)
+        self.pending_panel = PendingRequestsPanel(parent, title_font=self.F_HEADING,
+                                                  font=self.F_NORMAL, bold_font=self.F_BOLD)
         self.pending_panel.pack(fill=tk.X, pady=(0, 10))
     
     def _create_log_panel(self, parent):
@@ -692,7 +922,7 @@ class ElevatorUI:
                             highlightbackground=Colors.BORDER, highlightthickness=1)
         log_frame.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(log_frame, text="📜 Activity Log", font=('Segoe UI', 11, 'bold'),
+        tk.Label(log_frame, text="📜 Activity Log", font=self.F_HEADING,
                 bg=Colors.CARD_BG, fg=Colors.TEXT).pack(anchor=tk.W, padx=10, pady=(10, 5))
         
         log_container = tk.Frame(log_frame, bg=Colors.CARD_BG)
@@ -715,20 +945,87 @@ class ElevatorUI:
         self.log_text.tag_configure('success', foreground=Colors.SUCCESS)
         self.log_text.tag_configure('info', foreground=Colors.PRIMARY_GLOW)
         
+        # Read-only; _flush_log re-enables it only while writing
+        self.log_text.config(state='disabled')
+        
         self.log("System initialized", 'info')
         self.log(f"Starting at Floor {self.elevator.controller.get_current_floor()}", 'info')
     
     def log(self, message, tag=''):
-        """Add a message to the log."""
-        self.log_text.insert(tk.END, f"• {message}\n", tag)
-        self.log_text.see(tk.END)
+        """Add a message to the log (written out by _flush_log)."""
+        self._log_buffer.append((f"• {message}\n", tag))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Write buffered log lines with one insert and one scroll."""
+        self._log_flush_pending = False
+        buffer = self._log_buffer
+        if not buffer:
+            return
+        
+        # Merge consecutive lines that share a tag into (text, tag) chunks
+        chunks = []
+        texts, current_tag = [], buffer[0][1]
+        for text, tag in buffer:
+            if tag != current_tag:
+                chunks += ("".join(texts), current_tag)
+                texts, current_tag = [], tag
+            texts.append(text)
+        chunks += ("".join(texts), current_tag)
+        buffer.clear()
+        
+        log_text = self.log_text
+        log_text.config(state='normal')
+        log_text.insert(tk.END, *chunks)
+        
+        # Drop the oldest lines in one delete once the cap is exceeded
+        self._log_line_count += sum(text.count("\n") for text in chunks[::2])
+        if self._log_line_count > self.max_log_lines:
+            excess = self._log_line_count - self.log_trim_lines
+            log_text.delete('1.0', f'{excess + 1}.0')
+            self._log_line_count -= excess
+        log_text.config(state='disabled')
+        
+        # Scroll to the end only every 4th flush, or right away for emergencies;
+        # a skipped scroll is made up shortly after by _scroll_log
+        self._see_counter += 1
+        if self._see_counter % 4 == 0 or 'emergency' in chunks[1::2]:
+            log_text.see(tk.END)
+            self._log_unscrolled = False
+        else:
+            self._log_unscrolled = True
+            if not self._log_scroll_pending:
+                self._log_scroll_pending = True
+                self.root.after(250, self._scroll_log)
+    
+    def _scroll_log(self):
+        """Scroll to the newest log lines unless a later flush already did."""
+        self._log_scroll_pending = False
+        if self._log_unscrolled:
+            self._log_unscrolled = False
+            self.log_text.see(tk.END)
     
     def on_speed_change(self, value):
-        """Handle speed slider change."""
-        speed = float(value)
-        self.speed_label.config(text=f"{speed:.1f}x")
-        self.update_interval = int(self.base_interval / speed)
+        """Handle speed slider change, applying it at most every 50 ms."""
+        # Snap to 0.25x steps; slider motion within a step changes nothing
+        speed = round(float(value) * 4) / 4
+        if speed == self._pending_speed:
+            return
+        self._pending_speed = speed
+        if not self._speed_pending:
+            self._speed_pending = True
+            self.root.after(50, self._apply_speed)
+    
+    def _apply_speed(self):
+        """Apply the latest slider value to the simulation."""
+        self._speed_pending = False
+        speed = self._pending_speed
+        self.speed_label.config(text=f"{speed:.2f}x")
         self.elevator.set_speed(speed)
+        # Each step covers floors_per_step floors, so tick less often to match
+        self.update_interval = int(self.base_interval * self.elevator.floors_per_step / speed)
     
     def toggle_pause(self):
         """Toggle simulation pause state."""
@@ -748,6 +1045,7 @@ class ElevatorUI:
         
         self.elevator.add_external_request(floor, direction)
         self.log(f"External {direction} request: Floor {floor}", 'info')
+        self._wake()
     
     def handle_internal(self, floor):
         """Handle internal button press."""
@@ -757,6 +1055,7 @@ class ElevatorUI:
         
         self.elevator.add_internal_request(floor)
         self.log(f"Internal request: Floor {floor}", 'info')
+        self._wake()
     
     def _add_emergency_row(self, parent, row_index):
         """Add a new emergency request row to the table."""
@@ -773,19 +1072,19 @@ class ElevatorUI:
         # From dropdown
         from_var = tk.StringVar(value=str(row_index + 1))
         from_combo = ttk.Combobox(row_frame, textvariable=from_var,
-                                 values=[str(i) for i in range(1, self.num_floors + 1)],
+                                 values=self._floor_labels,
                                  width=8, state='readonly', style='Custom.TCombobox')
         from_combo.pack(side=tk.LEFT, padx=(0, 8))
         
         # Arrow
-        arrow_label = tk.Label(row_frame, text="→", font=('Segoe UI', 14),
+        arrow_label = tk.Label(row_frame, text="→", font=self.F_ARROW,
                               bg='#ffffff', fg='#000000')
         arrow_label.pack(side=tk.LEFT, padx=5)
         
         # To dropdown
         to_var = tk.StringVar(value=str(min(self.num_floors, row_index + 2)))
         to_combo = ttk.Combobox(row_frame, textvariable=to_var,
-                               values=[str(i) for i in range(1, self.num_floors + 1)],
+                               values=self._floor_labels,
                                width=8, state='readonly', style='Custom.TCombobox')
         to_combo.pack(side=tk.LEFT, padx=5)
         
@@ -794,7 +1093,7 @@ class ElevatorUI:
         btn_frame = tk.Frame(row_frame, bg='#ffffff')
         btn_frame.pack(side=tk.LEFT, padx=(10, 0))
         
-        action_btn = tk.Button(btn_frame, text="🚨", font=('Segoe UI', 12),
+        action_btn = tk.Button(btn_frame, text="🚨", font=self.F_ICON,
                               bg=Colors.DANGER, fg=Colors.TEXT,
                               relief='flat', cursor='hand2',
                               activebackground=Colors.DANGER_GLOW,
@@ -803,7 +1102,7 @@ class ElevatorUI:
                               highlightthickness=1,
                               highlightbackground='#ffffff',
                               highlightcolor='#ffffff',
-                              command=lambda: self.toggle_row_selection(row_index))
+                              command=partial(self.toggle_row_selection, row_index))
         action_btn.pack()
         
         # Store row data
@@ -833,19 +1132,18 @@ class ElevatorUI:
         selected_requests = []
         invalid_requests = []
         
-        # Collect all selected requests
-        for i, row_data in enumerate(self.emergency_rows):
-            if row_data['selected_var'].get():
-                try:
-                    from_floor = int(row_data['from_var'].get())
-                    to_floor = int(row_data['to_var'].get())
-                    
-                    if from_floor == to_floor:
-                        invalid_requests.append(f"Row {i+1}: From and To floors cannot be the same!")
-                    else:
-                        selected_requests.append((from_floor, to_floor))
-                except ValueError:
-                    invalid_requests.append(f"Row {i+1}: Invalid floor selection")
+        # Collect all selected requests. The comboboxes are readonly and only
+        # offer floor numbers, so int() cannot fail here
+        selected_rows = [(i, row_data) for i, row_data in enumerate(self.emergency_rows)
+                         if row_data['selected_var'].get()]
+        for i, row_data in selected_rows:
+            from_floor = int(row_data['from_var'].get())
+            to_floor = int(row_data['to_var'].get())
+            
+            if from_floor == to_floor:
+                invalid_requests.append(f"Row {i+1}: From and To floors cannot be the same!")
+            else:
+                selected_requests.append((from_floor, to_floor))
         
         # Show warnings for invalid requests
         if invalid_requests:
@@ -854,14 +1152,15 @@ class ElevatorUI:
         
         # Execute valid requests
         if selected_requests:
-            executed_count = 0
+            self.elevator.add_emergency_requests(selected_requests)
             for from_floor, to_floor in selected_requests:
-                self.elevator.add_emergency_request(from_floor, to_floor)
                 self.log(f"🚨 EMERGENCY: Floor {from_floor} → Floor {to_floor}", 'emergency')
-                executed_count += 1
+            executed_count = len(selected_requests)
+            
+            self._wake()
             
-            # Clear selections after execution
-            for row_data in self.emergency_rows:
+            # Clear selections after execution (only the rows that were checked)
+            for _, row_data in selected_rows:
                 row_data['selected_var'].set(False)
             
             messagebox.showinfo("Success", 
@@ -872,56 +1171,98 @@ class ElevatorUI:
     
     def update_display(self):
         """Update all display elements."""
-        status = self.elevator.get_detailed_status()
+        status = self.elevator.get_display_status()
+        if status == self._last_status:
+            return  # Nothing visible changed since the last redraw
+        self._last_status = status
+        
+        # Each widget below is only reconfigured when its value changed
         
         # Update floor display
-        self.floor_label.config(text=str(status['floor']))
+        if status.floor != self._last_floor:
+            self._last_floor = status.floor
+            self.floor_label.config(text=str(status.floor))
         
         # Update direction display
-        direction = status['direction']
-        if direction == "UP":
-            self.direction_label.config(text="UP ↑", fg=Colors.ELEVATOR_UP)
-        elif direction == "DOWN":
-            self.direction_label.config(text="DOWN ↓", fg=Colors.ELEVATOR_DOWN)
-        else:
-            self.direction_label.config(text="IDLE ●", fg=Colors.ELEVATOR_IDLE)
+        direction = status.direction
+        if direction != self._last_direction:
+            self._last_direction = direction
+            if direction == "UP":
+                self.direction_label.config(text="UP ↑", fg=Colors.ELEVATOR_UP)
+            elif direction == "DOWN":
+                self.direction_label.config(text="DOWN ↓", fg=Colors.ELEVATOR_DOWN)
+            else:
+                self.direction_label.config(text="IDLE ●", fg=Colors.ELEVATOR_IDLE)
         
         # Update emergency display
-        if status['emergency_mode']:
-            self.emergency_label.config(text=f"ON ({status['emergency_count']})", fg=Colors.DANGER)
-            self.emergency_card.config(highlightbackground=Colors.DANGER, highlightthickness=2)
-        else:
-            self.emergency_label.config(text="OFF", fg=Colors.TEXT_MUTED)
-            self.emergency_card.config(highlightbackground=Colors.BORDER, highlightthickness=1)
+        emergency = (status.emergency_mode, status.emergency_count)
+        if emergency != self._last_emergency:
+            self._last_emergency = emergency
+            if status.emergency_mode:
+                self.emergency_label.config(text=f"ON ({status.emergency_count})", fg=Colors.DANGER)
+                self.emergency_card.config(highlightbackground=Colors.DANGER, highlightthickness=2)
+            else:
+                self.emergency_label.config(text="OFF", fg=Colors.TEXT_MUTED)
+                self.emergency_card.config(highlightbackground=Colors.BORDER, highlightthickness=1)
         
         # Update elevator shaft visualization
-        self.shaft_viz.update_state(
-            status['floor'],
-            status['direction_enum'],
-            DoorState(status['door_state']),
-            status['emergency_mode']
-        )
+        shaft_state = (status.floor, status.direction_enum, status.door_state, status.emergency_mode)
+        if shaft_state != self._last_shaft_state:
+            self._last_shaft_state = shaft_state
+            self.shaft_viz.update_state(*shaft_state)
         
         # Update stats
-        stats = status.get('stats', {})
+        stats = status.stats
         self.floors_stat.set_value(stats.get('floors_traveled', 0))
         self.served_stat.set_value(stats.get('requests_served', 0))
         
         # Update pending requests
-        self.pending_panel.update_requests(status.get('pending_requests', {}))
+        self.pending_panel.update_requests(status.pending_requests)
     
     def start_simulation(self):
         """Start the simulation loop."""
-        def simulation_step():
-            arrived, message = self.elevator.update()
-            if message:
-                tag = 'emergency' if '🚨' in message or 'Emergency' in message else 'success'
-                self.log(message, tag)
-            
+        self._sim_after_id = self.root.after(self.update_interval, self._sim_tick)
+    
+    def _sim_tick(self):
+        """Advance the simulation one step and log what happened."""
+        arrived, message, tag = self.elevator.update()
+        if message:
+            self.log(message, tag)
+        
+        self._request_redraw()
+        
+        # Back off while nothing is happening; _wake() resumes normal ticks
+        idle = self.elevator.is_idle()
+        self._sleeping = idle and self._was_idle
+        self._was_idle = idle
+        if self._sleeping:
+            interval = max(self.idle_interval, self.update_interval)
+        else:
+            interval = self.update_interval
+        self._sim_after_id = self.root.after(interval, self._sim_tick)
+    
+    def _wake(self):
+        """Run the next simulation tick right away if the loop is idling."""
+        if not self._sleeping:
+            return
+        self._sleeping = False
+        self._was_idle = False
+        self.root.after_cancel(self._sim_after_id)
+        self._sim_after_id = self.root.after_idle(self._sim_tick)
+    
+    def _request_redraw(self):
+        """Mark the display dirty; _render_tick redraws at most every 33 ms."""
+        self._needs_redraw = True
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after(33, self._render_tick)
+    
+    def _render_tick(self):
+        """Redraw the display if anything changed since the last redraw."""
+        self._render_pending = False
+        if self._needs_redraw:
+            self._needs_redraw = False
             self.update_display()
-            self.root.after(self.update_interval, simulation_step)
-        
-        self.root.after(self.update_interval, simulation_step)
 
 
 def main():
@@ -1,5 +1,24 @@
 from typing import List, Tuple, Optional
-from constants import Direction, EmergencyRequest
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from constants import Direction
+
+
+def _in_group_a(from_floor: int, to_floor: int, current_floor: int, sign: int) -> bool:
+    """Pickup ahead in the travel direction, or here with the destination ahead."""
+    ahead = (from_floor - current_floor) * sign
+    return ahead > 0 or (ahead == 0 and (to_floor - current_floor) * sign > 0)
+
+
+@dataclass(slots=True)
+class EmergencyPlan:
+    """Next emergency move together with the sorted groups it was chosen from."""
+    target: Optional[int] = None
+    is_pickup: bool = False
+    request: Optional[Tuple[int, int]] = None
+    group_a: List[Tuple[int, int]] = field(default_factory=list)
+    group_b: List[Tuple[int, int]] = field(default_factory=list)
+    group_c: List[Tuple[int, int]] = field(default_factory=list)
 
 
 class EmergencyHandler:
@@ -9,6 +28,9 @@ class EmergencyHandler:
         self.queue_manager = queue_manager
         self.emergency_mode: bool = False
         self.emergency_count: int = 0
+        # Last sort_emergency_requests result, keyed on
+        # (current_floor, current_direction, queue_manager.emergency_version)
+        self._sort_cache: Optional[Tuple[tuple, tuple]] = None
         
     def trigger_emergency(self) -> None:
         """Trigger emergency mode - pause all normal requests."""
@@ -34,7 +56,7 @@ class EmergencyHandler:
     def sort_emergency_requests(
         self, 
         current_floor: int, 
-        current_direction: Direction | str
+        current_direction: Direction
     ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]], List[Tuple[int, int]]]:
         """
         Sort emergency requests into groups:
@@ -42,137 +64,119 @@ class EmergencyHandler:
         - Group B: Opposite direction (from_floor requires direction change)
         - Group C: Future (edge cases)
         
-        Returns: (group_a, group_b, group_c) as lists of (from_floor, to_floor) tuples
+        Returns: (group_a, group_b, group_c) as lists of (from_floor, to_floor) tuples.
+        The result is cached and shared between callers; do not modify it.
         """
-        # Convert direction to enum if string
-        if isinstance(current_direction, str):
-            try:
-                current_direction = Direction(current_direction)
-            except ValueError:
-                current_direction = Direction.IDLE
+        key = (current_floor, current_direction, self.queue_manager.emergency_version)
+        cache = self._sort_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
         
         group_a: List[Tuple[int, int]] = []  # Current direction
         group_b: List[Tuple[int, int]] = []  # Opposite direction
-        group_c: List[Tuple[int, int]] = []  # Edge cases
+        group_c: List[Tuple[int, int]] = []  # Edge cases (cannot occur for a valid Direction)
         
-        for emergency in self.queue_manager.emergency_requests:
-            if isinstance(emergency, EmergencyRequest):
-                from_floor = emergency.from_floor
-                to_floor = emergency.to_floor
-            else:
-                from_floor, to_floor = emergency
+        if current_direction == Direction.IDLE:
+            self._sort_by_distance(current_floor, group_a, group_b)
+        else:
+            # Requests are bucketed by pickup floor in arrival order, so walking
+            # the floors outward from the current one yields each group already
+            # sorted (nearest pickup first, ties in arrival order)
+            by_floor = self.queue_manager.emergency_by_floor
+            floors = sorted(by_floor)
+            split = bisect_left(floors, current_floor)
+            below = floors[split - 1::-1] if split else []
+            above = floors[split:]
+            if above and above[0] == current_floor:
+                above = above[1:]
+            ahead, behind = (above, below) if current_direction == Direction.UP else (below, above)
+            sign = current_direction.value
             
-            if current_direction == Direction.UP:
-                # Group A: from_floor is above current floor and in current direction
-                if from_floor > current_floor:
-                    group_a.append((from_floor, to_floor))
-                # Group B: from_floor is below current floor (opposite direction)
-                elif from_floor < current_floor:
-                    group_b.append((from_floor, to_floor))
-                # If from_floor == current_floor, we're already there, prioritize by destination
-                elif from_floor == current_floor:
-                    if to_floor > current_floor:
-                        group_a.append((from_floor, to_floor))
-                    else:
-                        group_b.append((from_floor, to_floor))
-                else:
-                    group_c.append((from_floor, to_floor))
-                    
-            elif current_direction == Direction.DOWN:
-                # Group A: from_floor is below current floor and in current direction
-                if from_floor < current_floor:
-                    group_a.append((from_floor, to_floor))
-                # Group B: from_floor is above current floor (opposite direction)
-                elif from_floor > current_floor:
-                    group_b.append((from_floor, to_floor))
-                # If from_floor == current_floor, we're already there
-                elif from_floor == current_floor:
-                    if to_floor < current_floor:
-                        group_a.append((from_floor, to_floor))
-                    else:
-                        group_b.append((from_floor, to_floor))
+            # Already at the pickup point: the destination decides the group
+            for emergency in by_floor.get(current_floor, ()):
+                request = (emergency.from_floor, emergency.to_floor)
+                if (emergency.to_floor - current_floor) * sign > 0:
+                    group_a.append(request)
                 else:
-                    group_c.append((from_floor, to_floor))
-                    
-            else:  # IDLE
-                # When idle, determine direction based on from_floor position
-                if from_floor > current_floor:
-                    group_a.append((from_floor, to_floor))
-                elif from_floor < current_floor:
-                    group_b.append((from_floor, to_floor))
-                else:  # from_floor == current_floor
-                    # Already at pickup point, determine by destination
-                    if to_floor > current_floor:
-                        group_a.append((from_floor, to_floor))
-                    else:
-                        group_b.append((from_floor, to_floor))
-        
-        # Sort groups by priority
-        # Group A: sort by from_floor (ascending for UP, descending for DOWN)
-        if current_direction == Direction.UP:
-            group_a.sort(key=lambda x: x[0])  # Sort by from_floor ascending
-        elif current_direction == Direction.DOWN:
-            group_a.sort(key=lambda x: x[0], reverse=True)  # Sort by from_floor descending
-        else:
-            group_a.sort(key=lambda x: abs(x[0] - current_floor))  # Closest first when idle
-        
-        # Group B: sort by from_floor (opposite of current direction)
-        if current_direction == Direction.UP:
-            group_b.sort(key=lambda x: x[0], reverse=True)  # Descending (going down)
-        elif current_direction == Direction.DOWN:
-            group_b.sort(key=lambda x: x[0])  # Ascending (going up)
-        else:
-            group_b.sort(key=lambda x: abs(x[0] - current_floor))  # Closest first when idle
+                    group_b.append(request)
+            
+            for group, floor_order in ((group_a, ahead), (group_b, behind)):
+                for floor in floor_order:
+                    group.extend((e.from_floor, e.to_floor) for e in by_floor[floor])
         
-        # Group C: sort by to_floor
-        group_c.sort(key=lambda x: abs(x[1] - current_floor))
+        groups = (group_a, group_b, group_c)
+        self._sort_cache = (key, groups)
+        return groups
+    
+    def _sort_by_distance(
+        self, 
+        current_floor: int, 
+        group_a: List[Tuple[int, int]], 
+        group_b: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Fill groups A/B for an idle elevator: A above (or here, heading up),
+        B the rest, each ordered closest first with ties in arrival order.
+        """
+        # Decorate each request with (group, distance, arrival index) so one
+        # sort orders both groups
+        decorated = []
+        for index, emergency in enumerate(self.queue_manager.emergency_requests.values()):
+            from_floor, to_floor = emergency.from_floor, emergency.to_floor
+            group = 0 if _in_group_a(from_floor, to_floor, current_floor, 1) else 1
+            decorated.append((group, abs(from_floor - current_floor), index, from_floor, to_floor))
         
-        return group_a, group_b, group_c
+        decorated.sort()
+        split = (group_a, group_b)
+        for group, _, _, from_floor, to_floor in decorated:
+            split[group].append((from_floor, to_floor))
     
-    def get_next_emergency_target(
+    def plan_next(
         self, 
         current_floor: int, 
-        current_direction: Direction | str
-    ) -> Tuple[Optional[int], bool]:
+        current_direction: Direction
+    ) -> EmergencyPlan:
         """
-        Get the next target floor for emergency handling.
-        Returns: (target_floor, is_pickup) where is_pickup indicates if we're going to pickup or destination
+        Sort the emergency requests once and choose the next move.
+        The returned plan carries the target, whether it is a pickup, the
+        request being served, and the three sorted groups.
         """
         if not self.queue_manager.has_emergency_requests():
-            return None, False
+            return EmergencyPlan()
         
         group_a, group_b, group_c = self.sort_emergency_requests(current_floor, current_direction)
+        plan = EmergencyPlan(group_a=group_a, group_b=group_b, group_c=group_c)
         
         # Priority: Group A > Group B > Group C
-        if group_a:
-            # Return the from_floor (pickup point) of the first request in Group A
-            from_floor, to_floor = group_a[0]
-            # Check if we're already at the pickup point
-            if current_floor == from_floor:
-                return to_floor, False  # Go to destination
-            else:
-                return from_floor, True  # Go to pickup point
-        
-        if group_b:
-            from_floor, to_floor = group_b[0]
-            if current_floor == from_floor:
-                return to_floor, False
-            else:
-                return from_floor, True
-        
-        if group_c:
-            from_floor, to_floor = group_c[0]
-            if current_floor == from_floor:
-                return to_floor, False
-            else:
-                return from_floor, True
+        for group in (group_a, group_b, group_c):
+            if group:
+                from_floor, to_floor = group[0]
+                plan.request = group[0]
+                # Check if we're already at the pickup point
+                if current_floor == from_floor:
+                    plan.target, plan.is_pickup = to_floor, False  # Go to destination
+                else:
+                    plan.target, plan.is_pickup = from_floor, True  # Go to pickup point
+                break
         
-        return None, False
+        return plan
+    
+    def get_next_emergency_target(
+        self, 
+        current_floor: int, 
+        current_direction: Direction
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Get the next target floor for emergency handling.
+        Returns: (target_floor, is_pickup) where is_pickup indicates if we're going to pickup or destination
+        """
+        plan = self.plan_next(current_floor, current_direction)
+        return plan.target, plan.is_pickup
     
     def get_groups_info(
         self, 
         current_floor: int, 
-        current_direction: Direction | str
+        current_direction: Direction
     ) -> dict:
         """Get information about the current emergency groups for display."""
         group_a, group_b, group_c = self.sort_emergency_requests(current_floor, current_direction)
@@ -183,9 +187,14 @@ class EmergencyHandler:
             'total': len(group_a) + len(group_b) + len(group_c)
         }
     
-    def complete_emergency_request(self, from_floor: int, to_floor: int) -> None:
+    def complete_emergency_request(
+        self,
+        from_floor: int,
+        to_floor: int,
+        now: Optional[float] = None
+    ) -> None:
         """Mark an emergency request as completed."""
-        self.queue_manager.remove_emergency_request(from_floor, to_floor)
+        self.queue_manager.remove_emergency_request(from_floor, to_floor, now)
         # Check if we should end emergency mode
         if not self.queue_manager.has_emergency_requests():
             self.end_emergency_mode()
@@ -1,15 +1,67 @@
-from typing import Set, List, Dict, Any, Optional
+from typing import List, Dict, Any, Final, Iterable, Optional, Tuple
 from dataclasses import dataclass, field
+from array import array
 import time
 from constants import Direction, EmergencyRequest, ElevatorStats
 
 
-@dataclass
+_UP: Final = "UP"
+_DOWN: Final = "DOWN"
+# Canonical direction name for every accepted spelling of UP/DOWN, so the
+# queue methods can branch on `is _UP` after a single lookup
+_DIR_STR: Final[Dict[Any, str]] = {Direction.UP: _UP, Direction.DOWN: _DOWN, _UP: _UP, _DOWN: _DOWN}
+
+
+# Timestamp slot value for "no request time recorded"
+_NO_TIME: Final = -1.0
+
+
+def _pop_time(times: array, floor: int) -> float:
+    """Clear and return a floor's timestamp (_NO_TIME if none was recorded)."""
+    if not 0 < floor < len(times):
+        return _NO_TIME
+    req_time = times[floor]
+    times[floor] = _NO_TIME
+    return req_time
+
+
+def _batch_mask(floors: Iterable[int], num_floors: int) -> Tuple[int, int]:
+    """Fold the valid floors of a batch into a bitmask. Returns (mask, valid count)."""
+    mask = 0
+    count = 0
+    for floor in floors:
+        if 1 <= floor <= num_floors:
+            mask |= 1 << floor
+            count += 1
+    return mask, count
+
+
+def _stamp_floors(times: array, mask: int, now: Optional[float]) -> None:
+    """Record one timestamp for every floor set in the mask."""
+    if now is None:
+        now = time.monotonic()
+    while mask:
+        low = mask & -mask
+        times[low.bit_length() - 1] = now
+        mask ^= low
+
+
+def mask_floors(mask: int) -> List[int]:
+    """List the floors whose bits are set in a floor bitmask, lowest first."""
+    floors = []
+    while mask:
+        low = mask & -mask
+        floors.append(low.bit_length() - 1)
+        mask ^= low
+    return floors
+
+
+@dataclass(slots=True)
 class RequestInfo:
     """Information about a pending request for display."""
     floor: int
     direction: Optional[str] = None
-    request_time: float = field(default_factory=time.time)
+    request_time: float = field(default_factory=time.monotonic)
     wait_time: float = 0.0
 
 
@@ -17,51 +69,82 @@ class QueueManager:
     """Manages all request queues with statistics tracking."""
     
     def __init__(self, num_floors: int = 10) -> None:
-        self.num_floors: int = num_floors
+        self.num_floors: Final[int] = num_floors
         
-        # Internal requests: floor numbers where someone pressed button inside
-        self.internal_requests: Set[int] = set()
+        # Request queues are floor bitmasks: bit `floor` is set while a
+        # request is pending there, so set bits read out in floor order
         
-        # External requests: floor numbers for UP/DOWN calls
-        self.external_up_requests: Set[int] = set()
-        self.external_down_requests: Set[int] = set()
+        # Internal requests: floors where someone pressed a button inside
+        self.internal_mask: int = 0
         
-        # Emergency requests: list of EmergencyRequest objects
-        self.emergency_requests: List[EmergencyRequest] = []
+        # External requests: floors with UP/DOWN calls
+        self.ext_up_mask: int = 0
+        self.ext_down_mask: int = 0
+        
+        # Emergency requests: EmergencyRequest objects keyed by
+        # (from_floor, to_floor), in arrival order
+        self.emergency_requests: Dict[Tuple[int, int], EmergencyRequest] = {}
+        # The same requests bucketed by pickup floor, each bucket in arrival
+        # order, so the scheduler can walk floors instead of classifying
+        self.emergency_by_floor: Dict[int, List[EmergencyRequest]] = {}
         
         # Paused normal requests (saved when emergency occurs)
-        self.paused_internal: Set[int] = set()
-        self.paused_external_up: Set[int] = set()
-        self.paused_external_down: Set[int] = set()
+        self.paused_internal_mask: int = 0
+        self.paused_ext_up_mask: int = 0
+        self.paused_ext_down_mask: int = 0
         self.is_paused: bool = False
         
-        # Request timestamps for wait time tracking
-        self.request_times: Dict[str, float] = {}
+        # Request timestamps for wait time tracking: one array per queue,
+        # indexed by floor, _NO_TIME where nothing is recorded
+        self.t_internal: array = array('d', [_NO_TIME]) * (num_floors + 1)
+        self.t_up: array = array('d', [_NO_TIME]) * (num_floors + 1)
+        self.t_down: array = array('d', [_NO_TIME]) * (num_floors + 1)
+        self.t_emergency: Dict[Tuple[int, int], float] = {}
+        
+        # Bumped whenever the active queues change, so callers can cache
+        # decisions derived from them
+        self.queue_version: int = 0
+        # Bumped only on emergency add/remove (see EmergencyHandler's sort cache)
+        self.emergency_version: int = 0
+        
+        # Last get_pending_requests_info result; rebuilt only after a
+        # mutation sets _info_dirty, otherwise just its wait times refresh
+        self._info_cache: Optional[Dict[str, List[RequestInfo]]] = None
+        self._info_dirty: bool = True
+        # RequestInfo objects from the last rebuild, keyed by (section,
+        # request key), so requests still pending keep their object
+        self._info_pool: Dict[Tuple[str, Any], RequestInfo] = {}
         
         # Statistics
         self.stats = ElevatorStats()
         
-    def _get_request_key(self, floor: int, req_type: str) -> str:
-        """Generate a unique key for request tracking."""
-        return f"{req_type}_{floor}"
-    
-    def add_internal_request(self, floor: int) -> bool:
+    def add_internal_request(self, floor: int, now: Optional[float] = None) -> bool:
         """
         Add an internal request (button pressed inside elevator).
         Returns True if request was added.
+        The add/remove methods take an optional `now` (a time.monotonic()
+        reading) so a caller handling several requests can sample it once.
         """
         if not 1 <= floor <= self.num_floors:
             return False
             
+        bit = 1 << floor
         if self.is_paused:
-            self.paused_internal.add(floor)
-        else:
-            if floor not in self.internal_requests:
-                self.internal_requests.add(floor)
-                self.request_times[self._get_request_key(floor, "internal")] = time.time()
+            self.paused_internal_mask |= bit
+            self._info_dirty = True
+        elif not self.internal_mask & bit:
+            self.internal_mask |= bit
+            self.t_internal[floor] = time.monotonic() if now is None else now
+            self.queue_version += 1
+            self._info_dirty = True
         return True
     
-    def add_external_request(self, floor: int, direction: str | Direction) -> bool:
+    def add_external_request(
+        self,
+        floor: int,
+        direction: str | Direction,
+        now: Optional[float] = None
+    ) -> bool:
         """
         Add an external request (UP or DOWN button pressed).
         Returns True if request was added.
@@ -69,26 +152,35 @@ class QueueManager:
         if not 1 <= floor <= self.num_floors:
             return False
             
-        if isinstance(direction, Direction):
-            direction = str(direction)
-            
+        direction = _DIR_STR.get(direction)
+        
+        bit = 1 << floor
         if self.is_paused:
-            if direction == "UP":
-                self.paused_external_up.add(floor)
+            if direction is _UP:
+                self.paused_ext_up_mask |= bit
             else:
-                self.paused_external_down.add(floor)
+                self.paused_ext_down_mask |= bit
+            self._info_dirty = True
+        elif direction is _UP:
+            if not self.ext_up_mask & bit:
+                self.ext_up_mask |= bit
+                self.t_up[floor] = time.monotonic() if now is None else now
+                self.queue_version += 1
+                self._info_dirty = True
         else:
-            if direction == "UP":
-                if floor not in self.external_up_requests:
-                    self.external_up_requests.add(floor)
-                    self.request_times[self._get_request_key(floor, "external_up")] = time.time()
-            else:
-                if floor not in self.external_down_requests:
-                    self.external_down_requests.add(floor)
-                    self.request_times[self._get_request_key(floor, "external_down")] = time.time()
+            if not self.ext_down_mask & bit:
+                self.ext_down_mask |= bit
+                self.t_down[floor] = time.monotonic() if now is None else now
+                self.queue_version += 1
+                self._info_dirty = True
         return True
     
-    def add_emergency_request(self, from_floor: int, to_floor: int) -> bool:
+    def add_emergency_request(
+        self,
+        from_floor: int,
+        to_floor: int,
+        now: Optional[float] = None
+    ) -> bool:
         """
         Add an emergency request.
         Returns True if request was added.
@@ -96,116 +188,241 @@ class QueueManager:
         if not (1 <= from_floor <= self.num_floors and 1 <= to_floor <= self.num_floors):
             return False
             
-        emergency = EmergencyRequest(from_floor=from_floor, to_floor=to_floor)
-        
         # Check for duplicates
-        if emergency not in self.emergency_requests:
-            self.emergency_requests.append(emergency)
-            self.request_times[self._get_request_key(from_floor, f"emergency_{to_floor}")] = time.time()
+        key = (from_floor, to_floor)
+        if key not in self.emergency_requests:
+            emergency = EmergencyRequest(from_floor=from_floor, to_floor=to_floor)
+            self.emergency_requests[key] = emergency
+            self.emergency_by_floor.setdefault(from_floor, []).append(emergency)
+            self.t_emergency[key] = time.monotonic() if now is None else now
+            self.queue_version += 1
+            self._info_dirty = True
+            self.emergency_version += 1
         return True
     
+    def add_internal_requests(
+        self,
+        floors: Iterable[int],
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Add several internal requests at once, with one timestamp.
+        Invalid floors are skipped. Returns the number of valid floors.
+        """
+        mask, count = _batch_mask(floors, self.num_floors)
+        if self.is_paused:
+            if mask:
+                self.paused_internal_mask |= mask
+                self._info_dirty = True
+        else:
+            new = mask & ~self.internal_mask
+            if new:
+                _stamp_floors(self.t_internal, new, now)
+                self.internal_mask |= new
+                self.queue_version += 1
+                self._info_dirty = True
+        return count
+    
+    def add_external_requests(
+        self,
+        floors: Iterable[int],
+        direction: str | Direction,
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Add several external requests in one direction, with one timestamp.
+        Invalid floors are skipped. Returns the number of valid floors.
+        """
+        mask, count = _batch_mask(floors, self.num_floors)
+        if not mask:
+            return count
+        
+        direction = _DIR_STR.get(direction)
+        
+        if self.is_paused:
+            if direction is _UP:
+                self.paused_ext_up_mask |= mask
+            else:
+                self.paused_ext_down_mask |= mask
+            self._info_dirty = True
+        elif direction is _UP:
+            new = mask & ~self.ext_up_mask
+            if new:
+                _stamp_floors(self.t_up, new, now)
+                self.ext_up_mask |= new
+                self.queue_version += 1
+                self._info_dirty = True
+        else:
+            new = mask & ~self.ext_down_mask
+            if new:
+                _stamp_floors(self.t_down, new, now)
+                self.ext_down_mask |= new
+                self.queue_version += 1
+                self._info_dirty = True
+        return count
+    
+    def add_emergency_requests(
+        self,
+        requests: Iterable[Tuple[int, int]],
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Add several (from_floor, to_floor) emergency requests with one timestamp.
+        Invalid requests are skipped. Returns the number of valid requests.
+        """
+        if now is None:
+            now = time.monotonic()
+        count = 0
+        for from_floor, to_floor in requests:
+            if self.add_emergency_request(from_floor, to_floor, now):
+                count += 1
+        return count
+    
     def pause_normal_requests(self) -> None:
         """Pause all normal requests and save them."""
         if not self.is_paused:
-            self.paused_internal = self.internal_requests.copy()
-            self.paused_external_up = self.external_up_requests.copy()
-            self.paused_external_down = self.external_down_requests.copy()
-            self.internal_requests.clear()
-            self.external_up_requests.clear()
-            self.external_down_requests.clear()
+            self.paused_internal_mask = self.internal_mask
+            self.paused_ext_up_mask = self.ext_up_mask
+            self.paused_ext_down_mask = self.ext_down_mask
+            self.internal_mask = 0
+            self.ext_up_mask = 0
+            self.ext_down_mask = 0
             self.is_paused = True
+            self.queue_version += 1
+            self._info_dirty = True
     
     def resume_normal_requests(self) -> None:
         """Resume normal requests after emergency is handled."""
         if self.is_paused:
-            self.internal_requests = self.paused_internal.copy()
-            self.external_up_requests = self.paused_external_up.copy()
-            self.external_down_requests = self.paused_external_down.copy()
-            self.paused_internal.clear()
-            self.paused_external_up.clear()
-            self.paused_external_down.clear()
+            self.internal_mask = self.paused_internal_mask
+            self.ext_up_mask = self.paused_ext_up_mask
+            self.ext_down_mask = self.paused_ext_down_mask
+            self.paused_internal_mask = 0
+            self.paused_ext_up_mask = 0
+            self.paused_ext_down_mask = 0
             self.is_paused = False
+            self.queue_version += 1
+            self._info_dirty = True
     
-    def remove_internal_request(self, floor: int) -> float:
+    def remove_internal_request(self, floor: int, now: Optional[float] = None) -> float:
         """
         Remove an internal request (elevator reached floor).
         Returns wait time for the request.
         """
-        self.internal_requests.discard(floor)
-        key = self._get_request_key(floor, "internal")
+        bit = 1 << floor
+        if self.internal_mask & bit:
+            self.internal_mask &= ~bit
+            self.queue_version += 1
+            self._info_dirty = True
         wait_time = 0.0
-        if key in self.request_times:
-            wait_time = time.time() - self.request_times.pop(key)
+        req_time = _pop_time(self.t_internal, floor)
+        if req_time >= 0:
+            wait_time = (time.monotonic() if now is None else now) - req_time
             self.stats.total_wait_time += wait_time
             self.stats.normal_requests_served += 1
         return wait_time
     
-    def remove_external_request(self, floor: int, direction: str | Direction) -> float:
+    def remove_external_request(
+        self,
+        floor: int,
+        direction: str | Direction,
+        now: Optional[float] = None
+    ) -> float:
         """
         Remove an external request (elevator reached floor).
         Returns wait time for the request.
         """
-        if isinstance(direction, Direction):
-            direction = str(direction)
-            
+        direction = _DIR_STR.get(direction)
+        
         wait_time = 0.0
-        if direction == "UP":
-            self.external_up_requests.discard(floor)
-            key = self._get_request_key(floor, "external_up")
+        bit = 1 << floor
+        if direction is _UP:
+            if self.ext_up_mask & bit:
+                self.ext_up_mask &= ~bit
+                self.queue_version += 1
+                self._info_dirty = True
+            req_time = _pop_time(self.t_up, floor)
         else:
-            self.external_down_requests.discard(floor)
-            key = self._get_request_key(floor, "external_down")
+            if self.ext_down_mask & bit:
+                self.ext_down_mask &= ~bit
+                self.queue_version += 1
+                self._info_dirty = True
+            req_time = _pop_time(self.t_down, floor)
             
-        if key in self.request_times:
-            wait_time = time.time() - self.request_times.pop(key)
+        if req_time >= 0:
+            wait_time = (time.monotonic() if now is None else now) - req_time
             self.stats.total_wait_time += wait_time
             self.stats.normal_requests_served += 1
         return wait_time
     
-    def remove_emergency_request(self, from_floor: int, to_floor: int) -> float:
+    def remove_emergency_request(
+        self,
+        from_floor: int,
+        to_floor: int,
+        now: Optional[float] = None
+    ) -> float:
         """
         Remove an emergency request.
         Returns wait time for the request.
         """
-        emergency = EmergencyRequest(from_floor=from_floor, to_floor=to_floor)
-        if emergency in self.emergency_requests:
-            self.emergency_requests.remove(emergency)
+        key = (from_floor, to_floor)
+        emergency = self.emergency_requests.pop(key, None)
+        if emergency is not None:
+            bucket = self.emergency_by_floor[from_floor]
+            bucket.remove(emergency)
+            if not bucket:
+                del self.emergency_by_floor[from_floor]
+            self.queue_version += 1
+            self._info_dirty = True
+            self.emergency_version += 1
             
-        key = self._get_request_key(from_floor, f"emergency_{to_floor}")
         wait_time = 0.0
-        if key in self.request_times:
-            wait_time = time.time() - self.request_times.pop(key)
+        req_time = self.t_emergency.pop(key, None)
+        if req_time is not None:
+            wait_time = (time.monotonic() if now is None else now) - req_time
             self.stats.total_wait_time += wait_time
             self.stats.emergency_requests_served += 1
         return wait_time
     
     def has_emergency_requests(self) -> bool:
         """Check if there are any emergency requests."""
-        return len(self.emergency_requests) > 0
+        return bool(self.emergency_requests)
     
     def has_normal_requests(self) -> bool:
         """Check if there are any normal requests."""
-        return (len(self.internal_requests) > 0 or 
-                len(self.external_up_requests) > 0 or 
-                len(self.external_down_requests) > 0)
+        return (self.internal_mask | self.ext_up_mask | self.ext_down_mask) != 0
     
     def has_paused_requests(self) -> bool:
         """Check if there are any paused normal requests."""
-        return (len(self.paused_internal) > 0 or
-                len(self.paused_external_up) > 0 or
-                len(self.paused_external_down) > 0)
+        return (self.paused_internal_mask | self.paused_ext_up_mask |
+                self.paused_ext_down_mask) != 0
     
     def get_all_requests(self) -> Dict[str, Any]:
         """Get all current normal requests for display."""
         return {
-            'internal': list(sorted(self.internal_requests)),
-            'external_up': list(sorted(self.external_up_requests)),
-            'external_down': list(sorted(self.external_down_requests, reverse=True))
+            'internal': mask_floors(self.internal_mask),
+            'external_up': mask_floors(self.ext_up_mask),
+            'external_down': mask_floors(self.ext_down_mask)[::-1]
         }
     
-    def get_pending_requests_info(self) -> Dict[str, List[RequestInfo]]:
-        """Get detailed info about all pending requests including wait times."""
-        current_time = time.time()
+    def get_pending_requests_info(
+        self,
+        now: Optional[float] = None
+    ) -> Dict[str, List[RequestInfo]]:
+        """
+        Get detailed info about all pending requests including wait times.
+        The result is cached and refreshed in place; treat it as read-only.
+        """
+        current_time = time.monotonic() if now is None else now
+        
+        info = self._info_cache
+        if info is not None and not self._info_dirty:
+            for key in ('internal', 'external_up', 'external_down', 'emergency'):
+                for req in info[key]:
+                    req.wait_time = current_time - req.request_time
+            for req in info['paused']:
+                req.request_time = current_time
+            return info
         
         info = {
             'internal': [],
@@ -215,52 +432,52 @@ class QueueManager:
             'paused': []
         }
         
+        # Timestamps outlive a pause, so walk the active queues (in display
+        # order) rather than the timestamp arrays
+        missing = False
+        pool, self._info_pool = self._info_pool, {}
+        
         # Internal requests
-        for floor in sorted(self.internal_requests):
-            key = self._get_request_key(floor, "internal")
-            req_time = self.request_times.get(key, current_time)
-            info['internal'].append(RequestInfo(
-                floor=floor,
-                direction=None,
-                request_time=req_time,
-                wait_time=current_time - req_time
-            ))
+        t_internal = self.t_internal
+        for floor in mask_floors(self.internal_mask):
+            req_time = t_internal[floor]
+            if req_time < 0:
+                req_time, missing = current_time, True
+            info['internal'].append(self._reuse_info(
+                pool, ('internal', floor), floor, None, req_time, current_time))
         
         # External UP requests
-        for floor in sorted(self.external_up_requests):
-            key = self._get_request_key(floor, "external_up")
-            req_time = self.request_times.get(key, current_time)
-            info['external_up'].append(RequestInfo(
-                floor=floor,
-                direction="UP",
-                request_time=req_time,
-                wait_time=current_time - req_time
-            ))
+        t_up = self.t_up
+        for floor in mask_floors(self.ext_up_mask):
+            req_time = t_up[floor]
+            if req_time < 0:
+                req_time, missing = current_time, True
+            info['external_up'].append(self._reuse_info(
+                pool, ('external_up', floor), floor, "UP", req_time, current_time))
         
         # External DOWN requests
-        for floor in sorted(self.external_down_requests, reverse=True):
-            key = self._get_request_key(floor, "external_down")
-            req_time = self.request_times.get(key, current_time)
-            info['external_down'].append(RequestInfo(
-                floor=floor,
-                direction="DOWN",
-                request_time=req_time,
-                wait_time=current_time - req_time
-            ))
+        t_down = self.t_down
+        for floor in reversed(mask_floors(self.ext_down_mask)):
+            req_time = t_down[floor]
+            if req_time < 0:
+                req_time, missing = current_time, True
+            info['external_down'].append(self._reuse_info(
+                pool, ('external_down', floor), floor, "DOWN", req_time, current_time))
         
         # Emergency requests
-        for emergency in self.emergency_requests:
-            key = self._get_request_key(emergency.from_floor, f"emergency_{emergency.to_floor}")
-            req_time = self.request_times.get(key, current_time)
-            info['emergency'].append(RequestInfo(
-                floor=emergency.from_floor,
-                direction=f"→{emergency.to_floor}",
-                request_time=req_time,
-                wait_time=current_time - req_time
-            ))
+        t_emergency = self.t_emergency
+        for key, emergency in self.emergency_requests.items():
+            req_time = t_emergency.get(key)
+            if req_time is None:
+                req_time, missing = current_time, True
+            info['emergency'].append(self._reuse_info(
+                pool, ('emergency', key), emergency.from_floor,
+                f"→{emergency.to_floor}", req_time, current_time))
         
         # Paused requests count
-        paused_count = len(self.paused_internal) + len(self.paused_external_up) + len(self.paused_external_down)
+        paused_count = (self.paused_internal_mask.bit_count() +
+                        self.paused_ext_up_mask.bit_count() +
+                        self.paused_ext_down_mask.bit_count())
         if paused_count > 0:
             info['paused'].append(RequestInfo(
                 floor=-1,
@@ -269,13 +486,34 @@ class QueueManager:
                 wait_time=0
             ))
         
+        # A request without a timestamp shows the current time, which the
+        # in-place refresh would freeze, so only cache complete results
+        self._info_cache = info
+        self._info_dirty = missing
         return info
     
+    def _reuse_info(
+        self,
+        pool: Dict[Tuple[str, Any], RequestInfo],
+        key: Tuple[str, Any],
+        floor: int,
+        direction: Optional[str],
+        req_time: float,
+        current_time: float
+    ) -> RequestInfo:
+        """Take a request's RequestInfo from the last rebuild, or make one."""
+        req = pool.get(key)
+        if req is None or req.request_time != req_time:
+            req = RequestInfo(floor=floor, direction=direction, request_time=req_time)
+        req.wait_time = current_time - req_time
+        self._info_pool[key] = req
+        return req
+    
     def get_total_pending_count(self) -> int:
         """Get total count of all pending requests."""
-        return (len(self.internal_requests) + 
-                len(self.external_up_requests) + 
-                len(self.external_down_requests) + 
+        return (self.internal_mask.bit_count() +
+                self.ext_up_mask.bit_count() +
+                self.ext_down_mask.bit_count() +
                 len(self.emergency_requests))
     
     def get_statistics(self) -> Dict[str, Any]:
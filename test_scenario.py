@@ -1,5 +1,8 @@
 from elevator_system import ElevatorSystem
+from queue_manager import QueueManager
+from emergency_handler import EmergencyHandler
 from constants import Direction
+import os
 import time
 import sys
 
@@ -7,6 +10,14 @@ import sys
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+# Seconds to sleep after each simulation step, for following the output
+# live (e.g. ELEV_DELAY=0.05); no delay by default
+DELAY = float(os.environ.get("ELEV_DELAY", "0"))
+
+# Constant pieces of the per-step status line
+_STEP_PREFIX = "Step "
+_STATUS_INDENT = "\n         "
+
 
 def print_header(text: str, char: str = "=") -> None:
     """Print a formatted header."""
@@ -17,11 +28,17 @@ def print_header(text: str, char: str = "=") -> None:
 
 def print_status(step: int, message: str, status: dict) -> None:
     """Print formatted step status."""
-    emergency_indicator = "[!]" if status['emergency_mode'] else "[OK]"
-    print(f"Step {step:2d}: {message}")
-    print(f"         {emergency_indicator} Floor: {status['floor']}, "
-          f"Direction: {status['direction']}, "
-          f"Emergency: {'ON' if status['emergency_mode'] else 'OFF'}")
+    if status['emergency_mode']:
+        emergency_indicator, emergency = "[!]", "ON"
+    else:
+        emergency_indicator, emergency = "[OK]", "OFF"
+    print("".join((
+        _STEP_PREFIX, format(step, "2d"), ": ", message,
+        _STATUS_INDENT, emergency_indicator,
+        " Floor: ", str(status['floor']),
+        ", Direction: ", status['direction'],
+        ", Emergency: ", emergency
+    )))
 
 
 def test_section_7_scenario() -> None:
@@ -68,7 +85,7 @@ def test_section_7_scenario() -> None:
     
     while step_count < max_steps:
         step_count += 1
-        arrived, message = elevator.update()
+        arrived, message, _ = elevator.update()
         
         if message:
             status = elevator.get_status()
@@ -92,7 +109,8 @@ def test_section_7_scenario() -> None:
                     break
         last_floor = current_floor
         
-        time.sleep(0.05)  # Small delay for readability
+        if DELAY:
+            time.sleep(DELAY)
     
     # Print final statistics
     print_header("Final Statistics", "-")
@@ -105,8 +123,8 @@ def test_section_7_scenario() -> None:
     print_header("Test Completed")
 
 
-def test_single_emergency() -> None:
-    """Test a single emergency request."""
+def test_single_emergency(verbose: bool = False) -> None:
+    """Test a single emergency request (per-step output only when verbose)."""
     print_header("Single Emergency Test")
     
     elevator = ElevatorSystem(num_floors=10, start_floor=5, start_direction=Direction.UP)
@@ -119,13 +137,330 @@ def test_single_emergency() -> None:
     
     print("\nSimulating...")
     for _ in range(30):
-        arrived, message = elevator.update()
+        arrived, message, _ = elevator.update()
         if message:
-            status = elevator.get_status()
-            print(f"  {message}")
+            if verbose:
+                print(f"  {message}")
             if str(elevator.controller.get_direction()) == "IDLE":
                 break
-        time.sleep(0.02)
+        if DELAY:
+            time.sleep(DELAY)
+    
+    stats = elevator.get_detailed_status()['stats']
+    print(f"  * Final Floor: {elevator.controller.get_current_floor()}")
+    print(f"  * Total Requests Served: {stats['requests_served']}")
+    print("\n[SUCCESS] Test completed")
+
+
+def test_batch_requests() -> None:
+    """Check the batch add APIs against the equivalent single adds."""
+    print_header("Batch Request Test")
+    
+    now = 100.0
+    floors = [0, 2, 5, 11, 5, 9]  # 0 and 11 are out of range, 5 repeats
+    down_floors = [3, 12, 8]      # 12 is out of range
+    emergencies = [(1, 4), (0, 3), (4, 11), (1, 4), (7, 2)]  # 2 invalid, 1 repeat
+    
+    for paused in (False, True):
+        batch = QueueManager(num_floors=10)
+        single = QueueManager(num_floors=10)
+        if paused:
+            batch.pause_normal_requests()
+            single.pause_normal_requests()
+        
+        count = batch.add_internal_requests(floors, now)
+        assert count == sum(single.add_internal_request(f, now) for f in floors) == 4
+        count = batch.add_external_requests(floors, "UP", now)
+        assert count == sum(single.add_external_request(f, "UP", now) for f in floors) == 4
+        count = batch.add_external_requests(down_floors, Direction.DOWN, now)
+        assert count == sum(single.add_external_request(f, Direction.DOWN, now)
+                            for f in down_floors) == 2
+        count = batch.add_emergency_requests(emergencies, now)
+        assert count == sum(single.add_emergency_request(a, b, now)
+                            for a, b in emergencies) == 3
+        
+        # Same pending requests and timestamps as the single adds
+        assert batch.get_pending_requests_info(now) == single.get_pending_requests_info(now)
+        assert list(batch.t_internal) == list(single.t_internal)
+        assert list(batch.t_up) == list(single.t_up)
+        assert list(batch.t_down) == list(single.t_down)
+        assert batch.t_emergency == single.t_emergency
+        
+        requests = batch.get_all_requests()
+        if paused:
+            # Held back until resume, then served like any other request
+            assert requests == {'internal': [], 'external_up': [], 'external_down': []}
+            batch.resume_normal_requests()
+            single.resume_normal_requests()
+            assert batch.get_pending_requests_info(now) == single.get_pending_requests_info(now)
+            requests = batch.get_all_requests()
+        assert requests == {'internal': [2, 5, 9], 'external_up': [2, 5, 9],
+                            'external_down': [8, 3]}
+        assert list(batch.emergency_requests) == [(1, 4), (7, 2)]
+        print(f"  * {'Paused' if paused else 'Normal'} batch adds match single adds")
+    
+    # ElevatorSystem wrappers: same counts, normal batches blocked in emergency mode
+    elevator = ElevatorSystem(num_floors=10, start_floor=1)
+    assert elevator.add_internal_requests(floors) == 4
+    assert elevator.add_external_requests(down_floors, "DOWN") == 2
+    assert elevator.add_emergency_requests(emergencies) == 3
+    assert elevator.emergency_handler.is_emergency_mode()
+    assert elevator.add_internal_requests([6]) == 0
+    assert elevator.queue_manager.get_total_pending_count() == 2
+    print("  * ElevatorSystem batch adds accepted 4 + 2 + 3 requests")
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def run_until_idle(elevator: ElevatorSystem, max_steps: int = 100) -> int:
+    """Step the elevator until is_idle() reports True. Returns the steps taken."""
+    for step in range(1, max_steps + 1):
+        elevator.update()
+        if elevator.is_idle():
+            return step
+    raise AssertionError(f"elevator not idle after {max_steps} steps")
+
+
+def test_idle_detection() -> None:
+    """Check ElevatorSystem.is_idle() across adds, emergencies and service."""
+    print_header("Idle Detection Test")
+    
+    elevator = ElevatorSystem(num_floors=10, start_floor=3, start_direction=Direction.IDLE)
+    assert elevator.is_idle()
+    
+    # A parked car that still has a direction settles to idle on the first step
+    moving = ElevatorSystem(num_floors=10, start_floor=3, start_direction=Direction.UP)
+    assert not moving.is_idle()
+    assert run_until_idle(moving) == 1
+    
+    elevator.add_internal_request(6)
+    assert not elevator.is_idle()
+    run_until_idle(elevator)
+    assert elevator.controller.get_current_floor() == 6
+    print("  * Idle again after serving an internal request")
+    
+    elevator.add_emergency_request(2, 8)
+    assert elevator.emergency_handler.is_emergency_mode()
+    assert not elevator.is_idle()
+    run_until_idle(elevator)
+    assert not elevator.emergency_handler.is_emergency_mode()
+    assert elevator.controller.get_current_floor() == 8
+    print("  * Idle again after the emergency was served")
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def test_status_cache() -> None:
+    """Check get_status() reuses its dict until the state changes."""
+    print_header("Status Cache Test")
+    
+    elevator = ElevatorSystem(num_floors=10, start_floor=1)
+    status = elevator.get_status()
+    assert elevator.get_status() is status
+    
+    elevator.update()
+    assert elevator.get_status() is not status
+    status = elevator.get_status()
+    assert elevator.get_status() is status
+    print("  * Fresh status after a step")
+    
+    elevator.add_internal_request(5)
+    assert elevator.get_status() is not status
+    assert elevator.get_status()['normal_requests']['internal'] == [5]
+    status = elevator.get_status()
+    elevator.add_external_requests([7], 'down')
+    assert elevator.get_status() is not status
+    print("  * Fresh status after add requests")
+    
+    status = elevator.get_status()
+    elevator.pause()
+    paused = elevator.get_status()
+    assert paused is not status and paused['is_paused']
+    assert elevator.get_status() is paused
+    elevator.resume()
+    assert elevator.get_status() is not paused
+    assert not elevator.get_status()['is_paused']
+    print("  * Fresh status after pause and resume")
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def run_at_speed(speed: float) -> list:
+    """Serve a fixed set of requests at the given speed. Returns the floors served, in order."""
+    elevator = ElevatorSystem(num_floors=10, start_floor=1)
+    elevator.set_speed(speed)
+    elevator.add_internal_requests([3, 4, 8, 9])
+    elevator.add_external_requests([6], 'up')
+    elevator.add_external_requests([7, 2], 'down')
+    
+    served = []
+    for _ in range(200):
+        if elevator.is_idle():
+            break
+        before = elevator.controller.get_current_floor()
+        requests = elevator.queue_manager.get_all_requests()
+        queued = set(requests['internal'])
+        arrived, message, _ = elevator.update()
+        after = elevator.controller.get_current_floor()
+        # External calls in the direction of travel are stops on the way too
+        queued.update(requests['external_up'] if after > before else
+                      requests['external_down'] if after < before else [])
+        target = elevator.controller.target_floor
+        if target is not None:
+            # Never move past the floor the car is heading for
+            assert (after - before) * (target - after) >= 0, (before, after, target)
+        # Floors strictly between the old and new position were passed without
+        # stopping; none of them may still be waiting for a stop
+        passed = range(min(before, after) + 1, max(before, after))
+        assert not queued.intersection(passed), (before, after, queued)
+        if arrived and "Served" in message:
+            served.append(after)
+    assert elevator.is_idle()
+    return served
+
+
+def test_speed_scenario() -> None:
+    """Check a 3x run serves the same requests as 1x without skipping floors."""
+    print_header("Speed Multiplier Test")
+    
+    normal = run_at_speed(1.0)
+    fast = run_at_speed(3.0)
+    print(f"  * 1x served: {normal}")
+    print(f"  * 3x served: {fast}")
+    assert fast == normal
+    assert sorted(normal) == [2, 3, 4, 6, 7, 8, 9]
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def test_emergency_plan() -> None:
+    """Check EmergencyHandler.plan_next() grouping, targets and its sort cache."""
+    print_header("Emergency Plan Test")
+    
+    queue = QueueManager(num_floors=10)
+    handler = EmergencyHandler(queue)
+    assert handler.plan_next(5, Direction.UP).target is None
+    
+    for from_floor, to_floor in [(2, 9), (8, 3), (6, 10), (5, 1), (5, 7)]:
+        queue.add_emergency_request(from_floor, to_floor)
+    
+    # Going up: pickups ahead (or here, heading up) nearest first, then the rest
+    plan = handler.plan_next(5, Direction.UP)
+    assert plan.group_a == [(5, 7), (6, 10), (8, 3)]
+    assert plan.group_b == [(5, 1), (2, 9)]
+    assert plan.group_c == []
+    # Already at the pickup floor, so head straight for the destination
+    assert plan.request == (5, 7) and plan.target == 7 and not plan.is_pickup
+    
+    plan = handler.plan_next(5, Direction.DOWN)
+    assert plan.group_a == [(5, 1), (2, 9)]
+    assert plan.group_b == [(5, 7), (6, 10), (8, 3)]
+    assert plan.request == (5, 1) and plan.target == 1 and not plan.is_pickup
+    
+    plan = handler.plan_next(7, Direction.UP)
+    assert plan.request == (8, 3) and plan.target == 8 and plan.is_pickup
+    assert handler.get_next_emergency_target(7, Direction.UP) == (8, True)
+    print("  * Groups A/B ordered nearest first, pickup vs destination")
+    
+    # Idle: equidistant pickups go to the one above, same-floor ties to the
+    # earlier request
+    queue = QueueManager(num_floors=10)
+    handler = EmergencyHandler(queue)
+    for from_floor, to_floor in [(3, 1), (7, 9), (7, 2)]:
+        queue.add_emergency_request(from_floor, to_floor)
+    plan = handler.plan_next(5, Direction.IDLE)
+    assert plan.group_a == [(7, 9), (7, 2)]
+    assert plan.group_b == [(3, 1)]
+    assert plan.target == 7 and plan.is_pickup
+    print("  * Equidistant ties broken by direction, then arrival order")
+    
+    # The sort is cached until the emergency queue changes
+    groups = handler.sort_emergency_requests(5, Direction.IDLE)
+    assert handler.sort_emergency_requests(5, Direction.IDLE) is groups
+    version = queue.emergency_version
+    queue.add_emergency_request(6, 4)
+    assert queue.emergency_version != version
+    plan = handler.plan_next(5, Direction.IDLE)
+    assert plan.group_a is not groups[0]
+    assert plan.group_a == [(6, 4), (7, 9), (7, 2)]
+    assert plan.target == 6
+    queue.remove_emergency_request(6, 4)
+    assert handler.plan_next(5, Direction.IDLE).group_a == [(7, 9), (7, 2)]
+    print("  * Cached sort refreshed when the emergency queue changes")
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def check_display_matches_status(elevator: ElevatorSystem) -> None:
+    """Assert get_display_status() agrees with get_status()."""
+    display = elevator.get_display_status()
+    status = elevator.get_status()
+    assert display.floor == status['floor']
+    assert display.direction == status['direction']
+    assert display.direction_enum == status['direction_enum']
+    assert str(display.door_state) == status['door_state']
+    assert display.emergency_mode == status['emergency_mode']
+    assert display.emergency_count == status['emergency_count']
+
+
+def test_display_status() -> None:
+    """Check get_display_status() mirrors get_status() and is cached."""
+    print_header("Display Status Test")
+    
+    elevator = ElevatorSystem(num_floors=10, start_floor=2)
+    check_display_matches_status(elevator)
+    display = elevator.get_display_status()
+    assert elevator.get_display_status() is display
+    
+    elevator.add_internal_request(4)
+    assert elevator.get_display_status() is not display
+    assert [info.floor for info in elevator.get_display_status().pending_requests['internal']] == [4]
+    check_display_matches_status(elevator)
+    print("  * Fresh display status after an add")
+    
+    elevator.add_emergency_request(6, 1)
+    check_display_matches_status(elevator)
+    for _ in range(20):
+        display = elevator.get_display_status()
+        elevator.update()
+        assert elevator.get_display_status() is not display
+        check_display_matches_status(elevator)
+        display = elevator.get_display_status()
+        assert elevator.get_display_status() is display
+    print("  * Fresh display status after each step, matching get_status()")
+    
+    print("\n[SUCCESS] Test completed")
+
+
+def test_step_tags() -> None:
+    """Check the tag update() returns for emergency, normal and quiet steps."""
+    print_header("Step Tag Test")
+    
+    elevator = ElevatorSystem(num_floors=10, start_floor=1, start_direction=Direction.IDLE)
+    assert elevator.update() == (False, None, None)
+    
+    elevator.add_internal_request(3)
+    results = [elevator.update() for _ in range(10)]
+    arrivals = [result for result in results if result[1] is not None]
+    assert len(arrivals) == 1
+    arrived, message, tag = arrivals[0]
+    assert arrived and "Internal Served" in message and tag == 'success'
+    # Every step without a message carries no tag
+    assert all(tag is None for _, message, tag in results if message is None)
+    print("  * Normal arrival tagged 'success'")
+    
+    elevator.add_emergency_request(5, 8)
+    results = [elevator.update() for _ in range(20)]
+    arrivals = [result for result in results if result[1] is not None]
+    assert [("Emergency Pickup" in message, "Emergency Complete" in message)
+            for _, message, _ in arrivals] == [(True, False), (False, True)]
+    assert all(tag == 'emergency' for _, _, tag in arrivals)
+    assert all(tag is None for _, message, tag in results if message is None)
+    print("  * Emergency pickup and drop-off tagged 'emergency'")
+    
+    elevator.pause()
+    assert elevator.step() == (False, None, None)
+    elevator.resume()
     
     print("\n[SUCCESS] Test completed")
 
@@ -133,4 +468,18 @@ def test_single_emergency() -> None:
 if __name__ == "__main__":
     test_section_7_scenario()
     print("\n" + "=" * 60 + "\n")
-    test_single_emergency()
+    test_single_emergency(verbose="-v" in sys.argv[1:])
+    print("\n" + "=" * 60 + "\n")
+    test_batch_requests()
+    print("\n" + "=" * 60 + "\n")
+    test_idle_detection()
+    print("\n" + "=" * 60 + "\n")
+    test_status_cache()
+    print("\n" + "=" * 60 + "\n")
+    test_speed_scenario()
+    print("\n" + "=" * 60 + "\n")
+    test_emergency_plan()
+    print("\n" + "=" * 60 + "\n")
+    test_display_status()
+    print("\n" + "=" * 60 + "\n")
+    test_step_tags()